@@ -0,0 +1,93 @@
+"""Peak memory of read-only commands, loaded vs streamed, as the data file grows.
+
+Run it with: python bench_streaming.py [max_records]
+
+Every run happens in a fresh subprocess so its peak RSS stays separate from the others.
+With json.load the peak should grow roughly in line with the file size.
+In streaming mode it should stay about the same.
+"""
+import contextlib
+import io
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import internship_tracker as it
+
+STATUSES = ['Not Applied', 'Applied', 'Interview Scheduled', 'Interview Completed',
+            'Accepted', 'Rejected', 'Withdrawn']
+SKILLS = sorted(set(skill for skills in it.ROLE_SKILLS.values() for skill in skills))
+
+
+def write_data_file(path, count):
+    """Write `count` fake internships one at a time so the generator itself stays small"""
+    rng = random.Random(count)
+    with open(path, 'w') as f:
+        f.write(f'{{\n    "schema_version": {it.CURRENT_SCHEMA_VERSION},\n    "internships": [\n')
+        for n in range(count):
+            internship = {
+                'id': n + 1,
+                'uid': f"{n:032x}",
+                'company': f"Company {rng.randint(1, 500)}",
+                'role': rng.choice(list(it.ROLE_SKILLS)),
+                'location': rng.choice(['Bangalore', 'Pune', 'Remote', 'Delhi', 'Hyderabad']),
+                'stipend': str(rng.choice([0, 10000, 25000, 60000])),
+                'duration': f"{rng.randint(2, 6)} months",
+                'skills': rng.sample(SKILLS, 4),
+                'status': rng.choice(STATUSES),
+                'date_added': f"2026-{rng.randint(1, 9):02d}-{rng.randint(1, 28):02d}",
+                'deadline': f"2026-{rng.randint(9, 12):02d}-{rng.randint(1, 28):02d}",
+                'notes': "x" * rng.randint(0, 200),
+                'url': '',
+                'last_updated': "2026-10-01 00:00:00",
+            }
+            f.write(('' if n == 0 else ',\n') + json.dumps(internship, indent=4))
+        f.write('\n    ]\n}\n')
+
+
+def measure(path, streaming):
+    """Child process side: run the read-only commands and report peak RSS in KB"""
+    start = time.perf_counter()
+    # Keep tiering out of it so both runs read the same file
+    tracker = it.InternshipTracker(path, streaming=streaming, archive_after_days=365 * 100)
+    with contextlib.redirect_stdout(io.StringIO()):
+        tracker.show_statistics()
+        tracker.show_upcoming_deadlines()
+        if streaming:
+            sum(1 for _ in tracker.query_engine.scan('status=Applied & location~pune', tracker._records()))
+        else:
+            tracker.query_engine.run('status=Applied & location~pune', tracker.internships)
+    elapsed = time.perf_counter() - start
+    print(json.dumps({'rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, 'seconds': elapsed}))
+
+
+def main():
+    max_records = int(sys.argv[1]) if len(sys.argv) > 1 else 400000
+    sizes = [max_records // 16, max_records // 4, max_records]
+
+    print(f"{'records':>10} {'file MB':>9} {'loaded MB':>10} {'streamed MB':>12} {'loaded s':>9} {'streamed s':>11}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in sizes:
+            path = os.path.join(tmp, f"internships_{count}.json")
+            write_data_file(path, count)
+            row = {}
+            for streaming in (False, True):
+                out = subprocess.run([sys.executable, __file__, '--child', path, str(int(streaming))],
+                                     capture_output=True, text=True, check=True,
+                                     cwd=os.path.dirname(os.path.abspath(__file__)))
+                row[streaming] = json.loads(out.stdout.strip().splitlines()[-1])
+            print(f"{count:>10} {os.path.getsize(path) / 2**20:>9.1f} "
+                  f"{row[False]['rss_kb'] / 1024:>10.1f} {row[True]['rss_kb'] / 1024:>12.1f} "
+                  f"{row[False]['seconds']:>9.2f} {row[True]['seconds']:>11.2f}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == '--child':
+        measure(sys.argv[2], sys.argv[3] == '1')
+    else:
+        main()
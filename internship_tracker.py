@@ -1,7 +1,26 @@
+import asyncio
+import bisect
+import gzip
+import hashlib
+import heapq
+import html
+import itertools
 import json
 import os
-from datetime import datetime, timedelta
-from collections import Counter
+import random
+import re
+import shutil
+import socket
+import socketserver
+import ssl
+import subprocess
+import sys
+import threading
+import time
+import urllib.parse
+import uuid
+from datetime import date, datetime, timedelta
+from collections import Counter, OrderedDict
 
 # Data stored - json file
 DATA_FILE = "internships.json"
@@ -20,24 +39,2227 @@ ROLE_SKILLS = {
     "Cybersecurity": ["Network Security", "Cryptography", "Ethical Hacking", "Linux", "Security Tools"]
 }
 
-class InternshipTracker:
+# Statuses where there's nothing left to do
+TERMINAL_STATUSES = ['Accepted', 'Rejected', 'Withdrawn']
+
+# Reminder settings - days before the deadline, and what time of day they go off
+REMINDER_OFFSETS = [7, 3, 0]
+REMINDER_HOUR = 9
+REMINDER_LOG_FILE = "reminders.log"
+# How often headless reminders (python internship_tracker.py remind) check the data file for edits
+REMINDER_RELOAD_SECONDS = 60
+
+
+class StdoutSink:
+    """Print reminders straight to the terminal"""
+    def send(self, title, message):
+        print(f"\n🔔 {title}: {message}")
+
+
+class FileSink:
+    """Append reminders to a log file so you can check them later"""
+    def __init__(self, path=REMINDER_LOG_FILE):
+        self.path = path
+
+    def send(self, title, message):
+        with open(self.path, 'a') as f:
+            f.write(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} {title}: {message}\n")
+
+
+class DesktopNotifySink:
+    """Desktop popup stub - uses notify-send when it's installed, otherwise just prints"""
+    def send(self, title, message):
+        if shutil.which('notify-send'):
+            subprocess.run(['notify-send', title, message], check=False)
+        else:
+            print(f"\n[desktop] {title}: {message}")
+
+
+class ReminderScheduler:
+    """Background thread that sleeps until the next deadline reminder is due.
+
+    The min-heap holds one entry per internship - its next reminder - and the
+    one after gets pushed when it fires. Changing a record's deadline or status
+    just gives it a new version and pushes a fresh entry; the old one gets
+    thrown away when it reaches the top, so we never rescan the whole list.
+    Reminders that already went off are remembered - in `state_file` too when
+    there is one, so neither an edit nor a restart can send them again.
+    """
+    # Wake up at least this often so a suspended laptop or clock change can't make us oversleep
+    MAX_SLEEP = 3600
+
+    def __init__(self, sinks, offsets=REMINDER_OFFSETS, state_file=None):
+        self.sinks = sinks
+        self.offsets = sorted(set(offsets), reverse=True)
+        self.state_file = state_file
+        self._heap = []
+        # id(internship) -> (version, schedule key, reminders left), only for records with any left
+        self._scheduled = {}
+        self._pending = 0
+        self._fired = self._load_fired()
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._thread = None
+        self._stopped = False
+
+    def _load_fired(self):
+        if not self.state_file or not os.path.exists(self.state_file):
+            return set()
+        try:
+            with open(self.state_file, 'r') as f:
+                fired = json.load(f)['fired']
+        except (ValueError, KeyError, TypeError) as e:
+            raise DataFileError(f"{self.state_file} is damaged ({e}) - delete it to start over "
+                                "(reminders already sent may go out again)") from e
+        # Reminders for deadlines that have passed can't fire again, so there's no point keeping them
+        today = datetime.now().strftime("%Y-%m-%d")
+        return set(tuple(key) for key in fired if key[2] >= today)
+
+    def _save_fired(self):
+        with self._cond:
+            fired = sorted(self._fired)
+        with open(self.state_file + ".tmp", 'w') as f:
+            json.dump({'fired': fired}, f)
+        os.replace(self.state_file + ".tmp", self.state_file)
+
+    @staticmethod
+    def _schedule_key(internship):
+        """The only fields that decide when (and whether) a record's reminders go off"""
+        return (internship['deadline'], internship['status'])
+
+    @staticmethod
+    def _fired_key(internship, offset):
+        return (internship['uid'], offset) + ReminderScheduler._schedule_key(internship)
+
+    def _plan(self, internship, now):
+        """The next heap entry for one internship and how many reminders it has left.
+
+        Returns (None, 0) when there's nothing left to remind about.
+        """
+        if not internship['deadline'] or internship['status'] in TERMINAL_STATUSES:
+            return None, 0
+        deadline_date = date.fromisoformat(internship['deadline'])
+        today = now.date()
+        
+        entry = None
+        left = 0
+        fired = self._fired
+        # Biggest offset first, so the first one still to come is the next to fire
+        for offset in self.offsets:
+            day = deadline_date - timedelta(days=offset)
+            # Missed days are gone, but today's slot is still worth a nudge even after the hour
+            if day < today or (fired and self._fired_key(internship, offset) in fired):
+                continue
+            left += 1
+            if entry is None:
+                fire_at = max(datetime(day.year, day.month, day.day, REMINDER_HOUR), now)
+                entry = (fire_at, next(self._seq), None, internship, offset)
+        return entry, left
+
+    def _schedule(self, internship, now, version, scheduled, heap, push):
+        """Work out a record's next reminder and note it in `scheduled`/`heap`; returns reminders left"""
+        entry, left = self._plan(internship, now)
+        if entry is None:
+            scheduled.pop(id(internship), None)
+            return 0
+        scheduled[id(internship)] = (version, self._schedule_key(internship), left)
+        entry = entry[:2] + (version,) + entry[3:]
+        if push:
+            heapq.heappush(heap, entry)
+        else:
+            heap.append(entry)
+        return left
+
+    def load(self, internships):
+        """Build the heap in one go - heapify is O(n), way cheaper than n pushes.
+
+        All the date parsing happens before taking the lock, so the reminder
+        thread is only held up for the swap.
+        """
+        now = datetime.now()
+        heap = []
+        scheduled = {}
+        pending = 0
+        for internship in internships:
+            pending += self._schedule(internship, now, next(self._seq), scheduled, heap, push=False)
+        heapq.heapify(heap)
+        
+        with self._cond:
+            self._heap = heap
+            self._scheduled = scheduled
+            self._pending = pending
+            self._cond.notify()
+
+    def record_changed(self, internship):
+        """Reschedule a single internship after it was added or edited"""
+        key = self._schedule_key(internship)
+        with self._cond:
+            current = self._scheduled.get(id(internship))
+            if current and current[1] == key:
+                # Notes and such don't move any reminders
+                return
+            self._pending -= current[2] if current else 0
+            self._pending += self._schedule(internship, datetime.now(), next(self._seq),
+                                            self._scheduled, self._heap, push=True)
+            self._cond.notify()
+
+    def record_removed(self, internship):
+        """Forget about a deleted internship - its heap entry turns stale"""
+        with self._cond:
+            current = self._scheduled.pop(id(internship), None)
+            self._pending -= current[2] if current else 0
+
+    def start(self):
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="reminders", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def pending(self):
+        """How many live reminders are still waiting to go off"""
+        with self._cond:
+            return self._pending
+
+    def _run(self):
+        while True:
+            due = []
+            with self._cond:
+                while not self._stopped and not due:
+                    if not self._heap:
+                        self._cond.wait()
+                        continue
+                    delay = (self._heap[0][0] - datetime.now()).total_seconds()
+                    if delay > 0:
+                        self._cond.wait(timeout=min(delay, self.MAX_SLEEP))
+                        continue
+                    # Grab everything that's due right now
+                    now = datetime.now()
+                    while self._heap and self._heap[0][0] <= now:
+                        _, _, version, internship, offset = heapq.heappop(self._heap)
+                        current = self._scheduled.get(id(internship))
+                        if current and current[0] == version:
+                            self._fired.add(self._fired_key(internship, offset))
+                            due.append((internship, offset))
+                            # Line up its next reminder in place of this one
+                            self._pending -= current[2]
+                            self._pending += self._schedule(internship, now, next(self._seq),
+                                                            self._scheduled, self._heap, push=True)
+                if self._stopped:
+                    return
+            
+            for internship, offset in due:
+                self._fire(internship, offset)
+            if due and self.state_file:
+                try:
+                    self._save_fired()
+                except OSError as e:
+                    print(f"\n⚠️ Couldn't save which reminders went out: {e}")
+
+    def _fire(self, internship, offset):
+        when = "TODAY" if offset == 0 else f"in {offset} day{'s' if offset != 1 else ''}"
+        title = f"Deadline {when}"
+        message = (f"ID {internship['id']}: {internship['role']} at {internship['company']} "
+                   f"(due {internship['deadline']}, status: {internship['status']})")
+        for sink in self.sinks:
+            try:
+                sink.send(title, message)
+            except OSError as e:
+                print(f"\n⚠️ Reminder sink {type(sink).__name__} failed: {e}")
+
+
+# Query language - which record key each field name maps to
+QUERY_FIELDS = {
+    'company': 'company',
+    'role': 'role',
+    'location': 'location',
+    'status': 'status',
+    'stipend': 'stipend',
+    'duration': 'duration',
+    'notes': 'notes',
+    'skill': 'skills',
+    'skills': 'skills',
+    'deadline': 'deadline',
+    'added': 'date_added',
+}
+DATE_FIELDS = ['deadline', 'date_added']
+# Longest first so '<=' doesn't get read as '<'
+QUERY_OPERATORS = ['<=', '>=', '!=', '=', '~', ':', '<', '>']
+RANGE_OPERATORS = ['<', '<=', '>', '>=']
+QUERY_CACHE_SIZE = 64
+
+
+class QueryError(ValueError):
+    """Something's wrong with a filter expression"""
+
+
+def _stipend_amount(stipend):
+    """Pull a number out of a stipend string - 'Unpaid' counts as 0"""
+    stipend = stipend.lower()
+    if 'unpaid' in stipend:
+        return 0
+    numbers = re.findall(r'\d+', stipend)
+    return int(numbers[0]) if numbers else None
+
+
+def _resolve_date(value, today):
+    """Turn 'today', '+10d', '-2w' or 'YYYY-MM-DD' into a YYYY-MM-DD string"""
+    if value.lower() == 'today':
+        return today.strftime("%Y-%m-%d")
+    match = re.fullmatch(r'([+-]\d+)([dw])', value.lower())
+    if match:
+        days = int(match.group(1)) * (7 if match.group(2) == 'w' else 1)
+        return (today + timedelta(days=days)).strftime("%Y-%m-%d")
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").strftime("%Y-%m-%d")
+    except ValueError:
+        raise QueryError(f"Don't know what date '{value}' is (try today, +10d or YYYY-MM-DD)")
+
+
+class Condition:
+    """A single field/operator/value test, like location~bangalore"""
+    def __init__(self, field, op, value, today):
+        if field not in QUERY_FIELDS:
+            raise QueryError(f"Unknown field '{field}' (try: {', '.join(sorted(QUERY_FIELDS))})")
+        self.field = field
+        self.key = QUERY_FIELDS[field]
+        self.op = op
+        self.raw = value
+        
+        if self.key in DATE_FIELDS and op != '~':
+            self.value = _resolve_date(value, today)
+        elif self.key == 'stipend' and op in RANGE_OPERATORS:
+            try:
+                self.value = int(value)
+            except ValueError:
+                raise QueryError(f"Stipend comparisons need a number, got '{value}'")
+        elif op in RANGE_OPERATORS:
+            raise QueryError(f"'{op}' only works on deadline, added and stipend")
+        else:
+            self.value = value.lower()
+
+    def matches(self, internship):
+        field_value = internship[self.key]
+        
+        if self.key == 'skills':
+            skills = [s.lower() for s in field_value]
+            if self.op == '~':
+                return any(self.value in s for s in skills)
+            found = self.value in skills
+            return not found if self.op == '!=' else found
+        
+        if self.key == 'stipend' and self.op in RANGE_OPERATORS:
+            field_value = _stipend_amount(field_value)
+            if field_value is None:
+                return False
+        elif self.key in DATE_FIELDS and self.op != '~':
+            # ISO dates compare fine as strings; records with no date never match
+            if not field_value:
+                return self.op == '!='
+            field_value = field_value[:10]
+        else:
+            field_value = field_value.lower()
+        
+        if self.op == '=':
+            return field_value == self.value
+        if self.op == '!=':
+            return field_value != self.value
+        if self.op in ('~', ':'):
+            return self.value in field_value
+        if self.op == '<':
+            return field_value < self.value
+        if self.op == '<=':
+            return field_value <= self.value
+        if self.op == '>':
+            return field_value > self.value
+        return field_value >= self.value
+
+    def __str__(self):
+        return f"{self.field} {self.op} {self.value!r}"
+
+
+class AllOf:
+    """Every child has to match (a & b)"""
+    def __init__(self, children):
+        self.children = children
+
+    def matches(self, internship):
+        return all(child.matches(internship) for child in self.children)
+
+    def __str__(self):
+        return ' & '.join(f"({c})" if isinstance(c, AnyOf) else str(c) for c in self.children)
+
+
+class AnyOf:
+    """At least one child has to match (a | b)"""
+    def __init__(self, children):
+        self.children = children
+
+    def matches(self, internship):
+        return any(child.matches(internship) for child in self.children)
+
+    def __str__(self):
+        return ' | '.join(str(c) for c in self.children)
+
+
+class Negate:
+    """Flip the result of the child (!a)"""
+    def __init__(self, child):
+        self.child = child
+
+    def matches(self, internship):
+        return not self.child.matches(internship)
+
+    def __str__(self):
+        return f"!({self.child})"
+
+
+class QueryParser:
+    """Recursive-descent parser for filter expressions.
+
+    Grammar (| binds looser than &, ! binds tightest):
+        expr      := and ('|' and)*
+        and       := unary ('&' unary)*
+        unary     := '!' unary | '(' expr ')' | condition
+        condition := field op value
+    """
+    def __init__(self, text, today):
+        self.text = text
+        self.pos = 0
+        self.today = today
+
+    def parse(self):
+        node = self._parse_or()
+        self._skip_spaces()
+        if self.pos < len(self.text):
+            raise QueryError(f"Unexpected '{self.text[self.pos:]}'")
+        return node
+
+    def _skip_spaces(self):
+        while self.pos < len(self.text) and self.text[self.pos].isspace():
+            self.pos += 1
+
+    def _accept(self, char):
+        self._skip_spaces()
+        if self.text.startswith(char, self.pos):
+            self.pos += len(char)
+            return True
+        return False
+
+    def _parse_or(self):
+        children = [self._parse_and()]
+        while self._accept('|'):
+            children.append(self._parse_and())
+        return children[0] if len(children) == 1 else AnyOf(children)
+
+    def _parse_and(self):
+        children = [self._parse_unary()]
+        while self._accept('&'):
+            children.append(self._parse_unary())
+        return children[0] if len(children) == 1 else AllOf(children)
+
+    def _parse_unary(self):
+        if self._accept('!'):
+            return Negate(self._parse_unary())
+        if self._accept('('):
+            node = self._parse_or()
+            if not self._accept(')'):
+                raise QueryError("Missing ')'")
+            return node
+        return self._parse_condition()
+
+    def _parse_condition(self):
+        self._skip_spaces()
+        match = re.compile(r'[A-Za-z_]+').match(self.text, self.pos)
+        if not match:
+            raise QueryError(f"Expected a field name at '{self.text[self.pos:] or 'end of query'}'")
+        field = match.group().lower()
+        self.pos = match.end()
+        
+        self._skip_spaces()
+        op = next((o for o in QUERY_OPERATORS if self.text.startswith(o, self.pos)), None)
+        if op is None:
+            raise QueryError(f"Expected an operator after '{field}' (one of {' '.join(QUERY_OPERATORS)})")
+        self.pos += len(op)
+        
+        self._skip_spaces()
+        if self.pos < len(self.text) and self.text[self.pos] in '"\'':
+            quote = self.text[self.pos]
+            end = self.text.find(quote, self.pos + 1)
+            if end == -1:
+                raise QueryError("Unterminated quote")
+            value = self.text[self.pos + 1:end]
+            self.pos = end + 1
+        else:
+            start = self.pos
+            while self.pos < len(self.text) and self.text[self.pos] not in '&|)':
+                self.pos += 1
+            value = self.text[start:self.pos].strip()
+        if not value:
+            raise QueryError(f"Missing value for '{field}{op}'")
+        
+        return Condition(field, op, value, self.today)
+
+
+class QueryIndex:
+    """Lookup tables the planner can drive a query from.
+
+    Hash indexes on status and skill, plus sorted lists for deadline and date
+    added so ranges are just two bisects. Built once, then patched in place as
+    records change - edits that don't touch an indexed field cost nothing.
+    """
+    def __init__(self):
+        self.generation = 0
+        self._built = False
+        self.total = 0
+        self.by_status = {}
+        self.by_skill = {}
+        self.sorted_dates = {}
+        self._keys = {}
+
+    @staticmethod
+    def _key(internship):
+        """The indexed fields of a record - if these didn't change, nothing needs touching"""
+        return (internship['status'], tuple(internship['skills']), internship['deadline'], internship['date_added'])
+
+    def _add(self, internship, key):
+        status, skills, deadline, date_added = key
+        self.by_status.setdefault(status.lower(), {})[id(internship)] = internship
+        for skill in set(s.lower() for s in skills):
+            self.by_skill.setdefault(skill, {})[id(internship)] = internship
+        for field, day in (('deadline', deadline[:10]), ('date_added', date_added[:10])):
+            if day:
+                keys, rows = self.sorted_dates[field]
+                pos = bisect.bisect_right(keys, day)
+                keys.insert(pos, day)
+                rows.insert(pos, internship)
+        self._keys[id(internship)] = key
+
+    def _discard(self, internship):
+        key = self._keys.pop(id(internship), None)
+        if key is None:
+            return False
+        status, skills, deadline, date_added = key
+        for table, values in ((self.by_status, [status.lower()]), (self.by_skill, set(s.lower() for s in skills))):
+            for value in values:
+                bucket = table[value]
+                del bucket[id(internship)]
+                if not bucket:
+                    del table[value]
+        for field, day in (('deadline', deadline[:10]), ('date_added', date_added[:10])):
+            if day:
+                keys, rows = self.sorted_dates[field]
+                pos = next(p for p in range(bisect.bisect_left(keys, day), bisect.bisect_right(keys, day))
+                           if rows[p] is internship)
+                del keys[pos]
+                del rows[pos]
+        return True
+
+    def record_changed(self, internship):
+        if not self._built:
+            return
+        key = self._key(internship)
+        if self._keys.get(id(internship)) == key:
+            # Notes, stipend and friends aren't indexed - nothing to do
+            return
+        if not self._discard(internship):
+            self.total += 1
+        self._add(internship, key)
+        self.generation += 1
+
+    def record_removed(self, internship):
+        if self._built and self._discard(internship):
+            self.total -= 1
+            self.generation += 1
+
+    def refresh(self, internships):
+        """Build everything from scratch the first time, or if the list changed behind our back"""
+        if self._built and self.total == len(internships):
+            return
+        self.by_status = {}
+        self.by_skill = {}
+        self._keys = {}
+        for internship in internships:
+            self.by_status.setdefault(internship['status'].lower(), {})[id(internship)] = internship
+            for skill in set(s.lower() for s in internship['skills']):
+                self.by_skill.setdefault(skill, {})[id(internship)] = internship
+            self._keys[id(internship)] = self._key(internship)
+        
+        self.sorted_dates = {}
+        for key in DATE_FIELDS:
+            dated = sorted((i[key][:10], n, i) for n, i in enumerate(internships) if i[key])
+            self.sorted_dates[key] = ([d for d, _, _ in dated], [i for _, _, i in dated])
+        
+        self.total = len(internships)
+        self._built = True
+        self.generation += 1
+
+    def _range(self, condition):
+        keys, _ = self.sorted_dates[condition.key]
+        value = condition.value
+        if condition.op == '<':
+            return 0, bisect.bisect_left(keys, value)
+        if condition.op == '<=':
+            return 0, bisect.bisect_right(keys, value)
+        if condition.op == '>':
+            return bisect.bisect_right(keys, value), len(keys)
+        if condition.op == '>=':
+            return bisect.bisect_left(keys, value), len(keys)
+        return bisect.bisect_left(keys, value), bisect.bisect_right(keys, value)
+
+    def can_use(self, node):
+        if isinstance(node, AnyOf):
+            return all(self.can_use(child) for child in node.children)
+        if not isinstance(node, Condition):
+            return False
+        if node.key == 'status':
+            return node.op == '='
+        if node.key == 'skills':
+            return node.op in ('=', ':')
+        if node.key in DATE_FIELDS:
+            return node.op in RANGE_OPERATORS or node.op == '='
+        return False
+
+    def estimate(self, node):
+        """Rows we'd have to look at if this node drove the query"""
+        if isinstance(node, AnyOf):
+            return sum(self.estimate(child) for child in node.children)
+        if node.key == 'status':
+            return len(self.by_status.get(node.value, {}))
+        if node.key == 'skills':
+            return len(self.by_skill.get(node.value, {}))
+        start, end = self._range(node)
+        return end - start
+
+    def fetch(self, node):
+        if isinstance(node, AnyOf):
+            seen = set()
+            rows = []
+            for child in node.children:
+                for internship in self.fetch(child):
+                    if id(internship) not in seen:
+                        seen.add(id(internship))
+                        rows.append(internship)
+            return rows
+        # Hash buckets keep the order records arrived in, so put them back in list order
+        if node.key == 'status':
+            return sorted(self.by_status.get(node.value, {}).values(), key=lambda i: i['id'])
+        if node.key == 'skills':
+            return sorted(self.by_skill.get(node.value, {}).values(), key=lambda i: i['id'])
+        start, end = self._range(node)
+        return self.sorted_dates[node.key][1][start:end]
+
+    def describe(self, node):
+        if isinstance(node, AnyOf):
+            return "UNION of " + ", ".join(self.describe(child) for child in node.children)
+        if node.key in DATE_FIELDS:
+            return f"RANGE SCAN {node}"
+        return f"INDEX LOOKUP {node}"
+
+
+class QueryPlan:
+    """Which index drives the query and what's left to check per row"""
+    def __init__(self, tree, driver, residual):
+        self.tree = tree
+        self.driver = driver
+        self.residual = residual
+
+    @classmethod
+    def build(cls, tree, index):
+        """Pick the most selective indexable piece of the query to start from"""
+        conjuncts = tree.children if isinstance(tree, AllOf) else [tree]
+        usable = [c for c in conjuncts if index.can_use(c)]
+        if not usable:
+            return cls(tree, None, tree)
+        
+        driver = min(usable, key=index.estimate)
+        rest = [c for c in conjuncts if c is not driver]
+        if not rest:
+            residual = None
+        elif len(rest) == 1:
+            residual = rest[0]
+        else:
+            residual = AllOf(rest)
+        return cls(tree, driver, residual)
+
+    def execute(self, internships, index):
+        rows = index.fetch(self.driver) if self.driver else internships
+        if self.residual is None:
+            return list(rows), len(rows)
+        return [i for i in rows if self.residual.matches(i)], len(rows)
+
+
+class QueryEngine:
+    """Parses, plans and runs filter expressions, keeping compiled plans around"""
     def __init__(self):
-        self.internships = self.load_data()
+        self.index = QueryIndex()
+        self._plans = OrderedDict()
+
+    def record_changed(self, internship):
+        self.index.record_changed(internship)
+
+    def record_removed(self, internship):
+        self.index.record_removed(internship)
+
+    def plan(self, text, internships):
+        """Get a plan for the query, reusing the cached one when we can.
+
+        Returns (plan, cache_hit). Relative dates like +10d are pinned when the
+        query is parsed, so cached trees only live for the day; plans are redone
+        whenever an indexed field changes since the index stats they used are stale.
+        """
+        text = text.strip()
+        today = datetime.now()
+        self.index.refresh(internships)
+        
+        cached = self._plans.get(text)
+        if cached and cached[0] == today.date():
+            self._plans.move_to_end(text)
+            _, tree, generation, plan = cached
+            if generation == self.index.generation:
+                return plan, True
+        else:
+            tree = QueryParser(text, today).parse()
+        
+        plan = QueryPlan.build(tree, self.index)
+        self._plans[text] = (today.date(), tree, self.index.generation, plan)
+        self._plans.move_to_end(text)
+        if len(self._plans) > QUERY_CACHE_SIZE:
+            self._plans.popitem(last=False)
+        return plan, False
+
+    def run(self, text, internships, archived=None):
+        plan, _ = self.plan(text, internships)
+        results, _ = plan.execute(internships, self.index)
+        if archived is not None:
+            # No indexes on the archive - it's a straight scan when you ask for it
+            results.extend(i for i in archived if plan.tree.matches(i))
+        return results
+
+    def explain(self, text, internships, archived=None):
+        """Describe the chosen plan and how much work it actually did"""
+        plan, cache_hit = self.plan(text, internships)
+        results, examined = plan.execute(internships, self.index)
+        archived_examined = 0
+        if archived is not None:
+            for internship in archived:
+                archived_examined += 1
+                if plan.tree.matches(internship):
+                    results.append(internship)
+        
+        lines = [f"Query: {plan.tree}"]
+        if plan.driver:
+            lines.append(f"  → {self.index.describe(plan.driver)} (est. {self.index.estimate(plan.driver)} rows)")
+        else:
+            lines.append(f"  → FULL SCAN of {len(internships)} rows")
+        if plan.residual:
+            lines.append(f"  → FILTER {plan.residual}")
+        if archived is not None:
+            lines.append(f"  → plus ARCHIVE SCAN of {archived_examined} rows")
+            examined += archived_examined
+        lines.append(f"Rows examined: {examined} of {len(internships) + archived_examined}")
+        lines.append(f"Rows matched: {len(results)}")
+        lines.append(f"Plan cache: {'hit' if cache_hit else 'miss'}")
+        return lines
+
+    def scan(self, text, records):
+        """Streaming mode has no indexes - just test each record as it goes past"""
+        tree = QueryParser(text.strip(), datetime.now()).parse()
+        return (i for i in records if tree.matches(i))
+
+    def explain_scan(self, text, records):
+        tree = QueryParser(text.strip(), datetime.now()).parse()
+        examined = matched = 0
+        for internship in records:
+            examined += 1
+            matched += tree.matches(internship)
+        return [f"Query: {tree}",
+                f"  → STREAMING SCAN of {examined} rows (file too big to index)",
+                f"Rows examined: {examined}",
+                f"Rows matched: {matched}"]
+
+
+def days_until(deadline, today):
+    """Whole calendar days from `today` (a date) to a YYYY-MM-DD deadline - 0 means it's due today"""
+    return (date.fromisoformat(deadline) - today).days
+
+
+def advisor_score(internship, today):
+    """Score one internship for the smart advisor.
+
+    Returns (score, reasons), or None if it's already accepted/rejected and
+    not worth prioritizing. `today` is a date so the result only changes when
+    the calendar does.
+    """
+    score = 0
+    reasons = []
+    
+    # Skip if already accepted or rejected
+    if internship['status'] in ['Accepted', 'Rejected']:
+        return None
+    
+    # Factor 1: Deadline urgency (0-30 points)
+    if internship['deadline']:
+        days_left = days_until(internship['deadline'], today)
+        
+        if days_left < 0:
+            score += 5
+            reasons.append("⚠️ Overdue - apply ASAP if still interested")
+        elif days_left == 0:
+            score += 30
+            reasons.append("🔥 Deadline is TODAY - urgent!")
+        elif days_left <= 3:
+            score += 25
+            reasons.append(f"⏰ Only {days_left} days left - very urgent")
+        elif days_left <= 7:
+            score += 20
+            reasons.append(f"📌 {days_left} days left - should apply soon")
+        elif days_left <= 14:
+            score += 15
+            reasons.append(f"📅 {days_left} days left - good time to apply")
+        else:
+            score += 10
+    
+    # Factor 2: Application status (0-25 points)
+    if internship['status'] == 'Not Applied':
+        score += 25
+        reasons.append("✨ Haven't applied yet - fresh opportunity")
+    elif internship['status'] == 'Applied':
+        score += 15
+        reasons.append("📬 Already applied - might want to follow up")
+    elif internship['status'] == 'Interview Scheduled':
+        score += 30
+        reasons.append("💼 Interview coming up - prep time!")
+    elif internship['status'] == 'Interview Completed':
+        score += 20
+        reasons.append("🤞 Waiting for response - consider follow-up")
+    
+    # Factor 3: Skill requirements (0-20 points)
+    if len(internship['skills']) <= 3:
+        score += 20
+        reasons.append("💪 Fewer skills required - good match potential")
+    elif len(internship['skills']) <= 5:
+        score += 15
+    else:
+        score += 10
+    
+    # Factor 4: Stipend value (0-15 points) - higher stipend = higher priority
+    stipend_str = internship['stipend'].lower()
+    if 'unpaid' in stipend_str or stipend_str == '0':
+        score += 5
+    else:
+        # Try to extract numbers and score based on amount
+        numbers = re.findall(r'\d+', stipend_str)
+        if numbers:
+            amount = int(numbers[0])
+            if amount >= 50000:
+                score += 15
+                reasons.append("💰 Great stipend - high value opportunity")
+            elif amount >= 20000:
+                score += 12
+                reasons.append("💵 Good stipend offered")
+            else:
+                score += 8
+    
+    # Factor 5: How long it's been in your list (0-10 points)
+    date_added = datetime.strptime(internship['date_added'], "%Y-%m-%d").date()
+    days_in_list = (today - date_added).days
+    
+    if days_in_list >= 30:
+        score += 10
+        reasons.append("⌛ Been in your list for a while - time to act")
+    elif days_in_list >= 14:
+        score += 5
+    
+    return score, reasons
+
+
+def advisor_next_change(internship, today):
+    """Next date the deadline or days-in-list bucket (or the overdue flag) flips, if any"""
+    date_added = datetime.strptime(internship['date_added'], "%Y-%m-%d").date()
+    candidates = [date_added + timedelta(days=d) for d in (14, 30)]
+    if internship['deadline']:
+        deadline_date = datetime.strptime(internship['deadline'], "%Y-%m-%d").date()
+        # 14/7/3 days out, the day itself, and the day after (overdue)
+        candidates.extend(deadline_date - timedelta(days=d) for d in (14, 7, 3, 0, -1))
+    upcoming = [d for d in candidates if d > today]
+    return min(upcoming) if upcoming else None
+
+
+class IndexedHeap:
+    """Min-heap that remembers where each record sits.
+
+    That makes changing or removing a record's key O(log n) instead of a
+    rebuild, and top(k) only walks the k best branches - O(k log k).
+    """
+    def __init__(self):
+        self._items = []
+        self._pos = {}
+
+    def __len__(self):
+        return len(self._items)
+
+    def set(self, internship, key):
+        pos = self._pos.get(id(internship))
+        if pos is None:
+            self._items.append((key, internship))
+            self._pos[id(internship)] = len(self._items) - 1
+            self._sift_up(len(self._items) - 1)
+            return
+        old_key = self._items[pos][0]
+        self._items[pos] = (key, internship)
+        if key < old_key:
+            self._sift_up(pos)
+        else:
+            self._sift_down(pos)
+
+    def remove(self, internship):
+        pos = self._pos.pop(id(internship), None)
+        if pos is None:
+            return
+        last = self._items.pop()
+        if pos < len(self._items):
+            self._items[pos] = last
+            self._pos[id(last[1])] = pos
+            self._sift_up(pos)
+            self._sift_down(self._pos[id(last[1])])
+
+    def top(self, k):
+        """The k smallest (key, internship) pairs, in order"""
+        result = []
+        frontier = [(self._items[0][0], 0)] if self._items else []
+        while frontier and len(result) < k:
+            _, pos = heapq.heappop(frontier)
+            result.append(self._items[pos])
+            for child in (2 * pos + 1, 2 * pos + 2):
+                if child < len(self._items):
+                    heapq.heappush(frontier, (self._items[child][0], child))
+        return result
+
+    def _swap(self, a, b):
+        self._items[a], self._items[b] = self._items[b], self._items[a]
+        self._pos[id(self._items[a][1])] = a
+        self._pos[id(self._items[b][1])] = b
+
+    def _sift_up(self, pos):
+        while pos > 0:
+            parent = (pos - 1) // 2
+            if self._items[pos][0] >= self._items[parent][0]:
+                break
+            self._swap(pos, parent)
+            pos = parent
+
+    def _sift_down(self, pos):
+        size = len(self._items)
+        while True:
+            smallest = pos
+            for child in (2 * pos + 1, 2 * pos + 2):
+                if child < size and self._items[child][0] < self._items[smallest][0]:
+                    smallest = child
+            if smallest == pos:
+                return
+            self._swap(pos, smallest)
+            pos = smallest
+
+
+class AdvisorView:
+    """Materialized advisor scores, kept up to date instead of recomputed per visit.
+
+    A record only gets rescored when it's edited, or when the calendar moves
+    past one of its bucket boundaries (see advisor_next_change) - those dates
+    sit in a min-heap so a new day only touches the records that changed.
+    The pipeline counts for the insights section are kept alongside.
+    """
+    def __init__(self):
+        self.heap = IndexedHeap()
+        self.status_counts = Counter()
+        self.overdue = 0
+        self.today = None
+        self._state = {}
+        self._seq = itertools.count()
+        self._rollovers = []
+
+    @property
+    def built(self):
+        return self.today is not None
+
+    def refresh(self, internships, today):
+        """Build the view the first time, then just catch up on date rollovers"""
+        if not self.built:
+            self.today = today
+            for internship in internships:
+                self._rescore(internship)
+            return
+        if today == self.today:
+            return
+        
+        self.today = today
+        while self._rollovers and self._rollovers[0][0] <= today:
+            _, _, version, internship = heapq.heappop(self._rollovers)
+            state = self._state.get(id(internship))
+            if state and state['version'] == version:
+                self._rescore(internship)
+
+    def top(self, k):
+        return [internship for _, internship in self.heap.top(k)]
+
+    def record_changed(self, internship):
+        if self.built:
+            self._rescore(internship)
+
+    def record_removed(self, internship):
+        state = self._state.pop(id(internship), None)
+        if state:
+            self.heap.remove(internship)
+            self.status_counts[state['status']] -= 1
+            self.overdue -= state['overdue']
+
+    def _rescore(self, internship):
+        state = self._state.get(id(internship))
+        if state is None:
+            # seq keeps ties in list order, same as the old stable sort
+            state = {'seq': next(self._seq), 'version': 0, 'status': None, 'overdue': False}
+            self._state[id(internship)] = state
+        else:
+            self.status_counts[state['status']] -= 1
+            self.overdue -= state['overdue']
+        
+        state['version'] += 1
+        state['status'] = internship['status']
+        state['overdue'] = self._is_overdue(internship)
+        self.status_counts[state['status']] += 1
+        self.overdue += state['overdue']
+        
+        result = advisor_score(internship, self.today)
+        if result is None:
+            self.heap.remove(internship)
+        else:
+            self.heap.set(internship, (-result[0], state['seq']))
+        
+        next_change = advisor_next_change(internship, self.today)
+        if next_change:
+            heapq.heappush(self._rollovers, (next_change, state['seq'], state['version'], internship))
+
+    def _is_overdue(self, internship):
+        # ISO dates compare fine as strings
+        return bool(internship['deadline']) and internship['deadline'] < self.today.strftime("%Y-%m-%d")
+
+
+# Sync settings - the Merkle tree has MERKLE_DEPTH levels of 16-way fanout
+MERKLE_DEPTH = 3
+MERKLE_FANOUT = '0123456789abcdef'
+SYNC_PORT = 8765
+# The sync protocol has no auth, so the server only listens on this machine unless told otherwise
+SYNC_BIND_ADDRESS = '127.0.0.1'
+# op -> the JSON type of each argument it takes
+SYNC_OPS = {'root': [], 'children': [list], 'leaves': [list], 'get': [list], 'put': [dict]}
+
+
+def record_digest(internship):
+    """Content hash of a record - ids are local display numbers so they don't count"""
+    body = {k: v for k, v in internship.items() if k != 'id'}
+    return hashlib.sha256(json.dumps(body, sort_keys=True).encode()).hexdigest()
+
+
+def record_stamp(internship):
+    """When a record last changed, for last-writer-wins merges"""
+    return internship['last_updated']
+
+
+class SyncReplica:
+    """One side of a sync: a tracker's records hashed into a Merkle tree.
+
+    Records are bucketed by a hash of their uid, so two replicas can compare
+    root hashes and only walk down into the buckets that differ. Deletions are
+    kept as tombstones in a sidecar file so they sync too instead of the
+    record coming back from the other side. The tree is built on first use and
+    then patched as records change; hashes are only recomputed along dirty paths.
+    """
+    def __init__(self, tracker):
+        self.tracker = tracker
+        self.state_file = os.path.splitext(tracker.data_file)[0] + ".sync.json"
+        self.tombstones = {}
+        if os.path.exists(self.state_file):
+            try:
+                with open(self.state_file, 'r') as f:
+                    self.tombstones = json.load(f).get('tombstones', {})
+            except (ValueError, AttributeError) as e:
+                raise DataFileError(f"{self.state_file} is damaged ({e}). Nothing has been changed - "
+                                    "restore it from a backup, then start the tracker again.") from e
+        self._leaves = None
+        self._hashes = {}
+        self._dirty = set()
+        self._by_uid = {}
+        self._applying = False
+
+    def save_state(self):
+        # Write-then-rename, so a crash can't leave half a state file behind
+        with open(self.state_file + ".tmp", 'w') as f:
+            json.dump({'tombstones': self.tombstones}, f, indent=4)
+        os.replace(self.state_file + ".tmp", self.state_file)
+
+    @staticmethod
+    def _bucket(uid):
+        return hashlib.sha256(uid.encode()).hexdigest()[:MERKLE_DEPTH]
+
+    def _set_entry(self, uid, entry):
+        bucket = self._bucket(uid)
+        self._leaves.setdefault(bucket, {})[uid] = entry
+        self._dirty.add(bucket)
+
+    def _build(self):
+        self._leaves = {}
+        self._by_uid = {}
+        # Archiving is just where a record lives, so an archived record hashes the same as a live one
+        for uid, entry in self.tracker.archive.entries().items():
+            self._set_entry(uid, entry)
+        for uid, deleted_at in self.tombstones.items():
+            self._set_entry(uid, ('deleted:' + deleted_at, deleted_at))
+        for internship in self.tracker.internships:
+            self._by_uid[internship['uid']] = internship
+            self._set_entry(internship['uid'], (record_digest(internship), record_stamp(internship)))
+
+    def _refresh(self):
+        """Recompute hashes along the paths of any buckets that changed"""
+        if self._leaves is None:
+            self._build()
+        if not self._dirty:
+            return
+        
+        changed = self._dirty
+        for bucket in changed:
+            entries = self._leaves.get(bucket, {})
+            leaf = ''.join(f"{uid}:{digest};" for uid, (digest, _) in sorted(entries.items()))
+            self._hashes[bucket] = hashlib.sha256(leaf.encode()).hexdigest()
+        for depth in range(MERKLE_DEPTH - 1, -1, -1):
+            changed = set(path[:depth] for path in changed)
+            for path in changed:
+                children = ''.join(self._hash(path + c) for c in MERKLE_FANOUT)
+                self._hashes[path] = hashlib.sha256(children.encode()).hexdigest()
+        self._dirty = set()
+
+    def _hash(self, path):
+        return self._hashes.get(path) or hashlib.sha256(b'').hexdigest()
+
+    # Listener hooks - keep the tree in step with local edits
+    def record_changed(self, internship):
+        if self.tombstones.pop(internship['uid'], None) is not None and not self._applying:
+            self.save_state()
+        if self._leaves is not None:
+            self._by_uid[internship['uid']] = internship
+            self._set_entry(internship['uid'], (record_digest(internship), record_stamp(internship)))
+
+    def record_removed(self, internship):
+        deleted_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.tombstones[internship['uid']] = deleted_at
+        if not self._applying:
+            self.save_state()
+        if self._leaves is not None:
+            self._by_uid.pop(internship['uid'], None)
+            self._set_entry(internship['uid'], ('deleted:' + deleted_at, deleted_at))
+
+    # Peer protocol - everything here is plain JSON so it can go over a socket
+    def root(self):
+        self._refresh()
+        return self._hash('')
+
+    def children(self, paths):
+        self._refresh()
+        return {path: [self._hash(path + c) for c in MERKLE_FANOUT] for path in paths}
+
+    def leaves(self, paths):
+        self._refresh()
+        return {path: {uid: list(entry) for uid, entry in self._leaves.get(path, {}).items()}
+                for path in paths}
+
+    def get(self, uids):
+        self._refresh()
+        items = {}
+        archived = []
+        for uid in uids:
+            if uid in self._by_uid:
+                items[uid] = self._by_uid[uid]
+            elif uid in self.tombstones:
+                items[uid] = {'uid': uid, 'deleted': self.tombstones[uid]}
+            else:
+                archived.append(uid)
+        if archived:
+            items.update(self.tracker.archive.get(archived))
+        return items
+
+    def put(self, items):
+        """Apply records/tombstones that won the merge on the other side"""
+        self._refresh()
+        cutoff = self.tracker.archive_cutoff()
+        self._applying = True
+        try:
+            for item in items.values():
+                if not item.get('deleted'):
+                    # The other side might be running an older version - make sure it's full shape
+                    item = normalize_record(item)
+                existing = self._by_uid.get(item['uid'])
+                if item.get('deleted'):
+                    if existing:
+                        self.tracker._remove_record(existing)
+                    self.tracker.archive.discard(item['uid'])
+                    self.tombstones[item['uid']] = item['deleted']
+                    self._set_entry(item['uid'], ('deleted:' + item['deleted'], item['deleted']))
+                    continue
+                if is_archivable(item, cutoff):
+                    # Finished a while back - it belongs in our archive, whichever side had it live
+                    if existing:
+                        self.tracker._remove_record(existing)
+                        self.tombstones.pop(item['uid'], None)
+                    self.tracker.archive.append([item])
+                    self._set_entry(item['uid'], (record_digest(item), record_stamp(item)))
+                    continue
+                # Edited since we archived it (if we ever did) - it's live again
+                self.tracker.archive.discard(item['uid'])
+                if existing:
+                    local_id = existing['id']
+                    existing.clear()
+                    existing.update(item)
+                    existing['id'] = local_id
+                    self.tracker._record_changed(existing)
+                else:
+                    internship = dict(item)
+                    internship['id'] = len(self.tracker.internships) + 1
+                    self.tracker.internships.append(internship)
+                    self.tracker._record_changed(internship)
+        finally:
+            self._applying = False
+        self.tracker.save_data()
+        self.save_state()
+        return len(items)
+
+
+class SocketPeer:
+    """Talks the replica protocol to a sync server, one JSON line per call"""
+    def __init__(self, host, port=SYNC_PORT):
+        self.sock = socket.create_connection((host, port), timeout=30)
+        self.stream = self.sock.makefile('rwb')
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    def _call(self, op, *args):
+        request = json.dumps({'op': op, 'args': args}).encode() + b'\n'
+        self.stream.write(request)
+        self.stream.flush()
+        response = self.stream.readline()
+        if not response:
+            raise ConnectionError("Sync server hung up")
+        self.bytes_sent += len(request)
+        self.bytes_received += len(response)
+        reply = json.loads(response)
+        if 'error' in reply:
+            raise ConnectionError(reply['error'])
+        return reply['result']
+
+    def root(self):
+        return self._call('root')
+
+    def children(self, paths):
+        return self._call('children', paths)
+
+    def leaves(self, paths):
+        return self._call('leaves', paths)
+
+    def get(self, uids):
+        return self._call('get', uids)
+
+    def put(self, items):
+        return self._call('put', items)
+
+    def close(self):
+        self.stream.close()
+        self.sock.close()
+
+
+class SyncRequestHandler(socketserver.StreamRequestHandler):
+    """Answers replica protocol calls for whoever connects"""
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("a request has to be a JSON object")
+                op, args = request.get('op'), request.get('args', [])
+                if op not in SYNC_OPS:
+                    raise ValueError(f"unknown op {op!r}")
+                expected = SYNC_OPS[op]
+                if (not isinstance(args, list) or len(args) != len(expected)
+                        or not all(isinstance(arg, kind) for arg, kind in zip(args, expected))):
+                    raise ValueError(f"{op} takes ({', '.join(kind.__name__ for kind in expected)})")
+                reply = {'result': getattr(self.server.replica, op)(*args)}
+            except Exception as e:
+                # Whatever a peer sends, it gets an error line back rather than a dropped connection
+                reply = {'error': f"{type(e).__name__}: {e}"}
+            self.wfile.write(json.dumps(reply).encode() + b'\n')
+
+
+class SyncServer(socketserver.TCPServer):
+    """Serves one peer at a time, so puts and saves never run side by side"""
+    allow_reuse_address = True
+    
+    def __init__(self, replica, host=SYNC_BIND_ADDRESS, port=SYNC_PORT):
+        super().__init__((host, port), SyncRequestHandler)
+        self.replica = replica
+
+
+def sync_replicas(local, peer):
+    """Two-way sync: find differing buckets top-down, then last writer wins per record.
+
+    Only subtrees whose hashes differ are ever sent, so the work scales with
+    how much changed rather than how many records there are.
+    """
+    stats = {'round_trips': 1, 'buckets': 0, 'pulled': 0, 'pushed': 0}
+    if local.root() == peer.root():
+        return stats
+    
+    frontier = ['']
+    for _ in range(MERKLE_DEPTH):
+        theirs = peer.children(frontier)
+        ours = local.children(frontier)
+        stats['round_trips'] += 1
+        frontier = [path + c
+                    for path in frontier
+                    for c, mine, other in zip(MERKLE_FANOUT, ours[path], theirs[path])
+                    if mine != other]
+    stats['buckets'] = len(frontier)
+    
+    theirs = peer.leaves(frontier)
+    ours = local.leaves(frontier)
+    stats['round_trips'] += 1
+    pull, push = [], []
+    for path in frontier:
+        mine, other = ours[path], theirs[path]
+        for uid in set(mine) | set(other):
+            if uid not in other:
+                push.append(uid)
+            elif uid not in mine:
+                pull.append(uid)
+            elif mine[uid][0] != other[uid][0]:
+                # Newer stamp wins; on a tie the bigger digest does, so both sides agree
+                if (mine[uid][1], mine[uid][0]) > (other[uid][1], other[uid][0]):
+                    push.append(uid)
+                else:
+                    pull.append(uid)
+    
+    if pull:
+        local.put(peer.get(pull))
+        stats['round_trips'] += 2
+    if push:
+        peer.put(local.get(push))
+        stats['round_trips'] += 1
+    stats['pulled'] = len(pull)
+    stats['pushed'] = len(push)
+    return stats
+
+
+# Terminal records untouched for this many days get moved to the cold archive
+ARCHIVE_AFTER_DAYS = 30
+
+
+class ColdArchive:
+    """Compressed, append-only home for finished applications.
+
+    Records go into a gzipped JSON-lines file (each append is its own gzip
+    member, so nothing is ever rewritten). Running totals live in a small
+    stats file so statistics never have to open the archive itself. The
+    index file has a line per uid saying which copy is current, so a newer
+    copy from sync can supersede an older one and sync can see what's here.
+    """
+    def __init__(self, data_file):
+        base = os.path.splitext(data_file)[0]
+        self.path = base + ".archive.jsonl.gz"
+        self.stats_file = base + ".archive.stats.json"
+        self.index_file = base + ".archive.uids"
+        self._index = None
+        self.stats = {'total': 0, 'status': {}, 'companies': {}, 'skills': {}}
+        if os.path.exists(self.stats_file):
+            try:
+                with open(self.stats_file, 'r') as f:
+                    self.stats = json.load(f)
+            except ValueError as e:
+                raise DataFileError(f"{self.stats_file} is damaged ({e}). Nothing has been changed - "
+                                    "restore it from a backup, then start the tracker again.") from e
+
+    @staticmethod
+    def _summary(internship):
+        """What the index keeps per record - enough to sync on and to undo its stats"""
+        return {'uid': internship['uid'], 'stamp': record_stamp(internship), 'digest': record_digest(internship),
+                'status': internship['status'], 'company': internship['company'], 'skills': internship['skills']}
+
+    def _load_index(self):
+        # Only needed by sync and archive searches, so don't pay for it at startup
+        if self._index is not None:
+            return self._index
+        self._index = {}
+        legacy = False
+        if os.path.exists(self.index_file):
+            with open(self.index_file, 'r') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    if not line.startswith('{'):
+                        legacy = True
+                        break
+                    entry = json.loads(line)
+                    if entry.get('removed'):
+                        self._index.pop(entry['uid'], None)
+                    else:
+                        self._index[entry['uid']] = entry
+        if legacy:
+            # Older archives only listed uids - rebuild the summaries from the records themselves
+            self._index = {i['uid']: self._summary(i) for i in self._read_all()}
+            with open(self.index_file + ".tmp", 'w') as f:
+                for entry in self._index.values():
+                    f.write(json.dumps(entry) + "\n")
+            os.replace(self.index_file + ".tmp", self.index_file)
+        return self._index
+
+    def _read_all(self):
+        """Every copy ever appended, superseded ones included"""
+        if not os.path.exists(self.path):
+            return
+        with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+            for line in f:
+                yield normalize_record(json.loads(line))
+
+    def _count(self, entry, step):
+        """Add a record's summary to the running totals, or take it back out"""
+        stats = self.stats
+        stats['total'] += step
+        for key, values in (('status', [entry['status']]), ('companies', [entry['company']]),
+                            ('skills', entry['skills'])):
+            for value in values:
+                stats[key][value] = stats[key].get(value, 0) + step
+                if stats[key][value] <= 0:
+                    del stats[key][value]
+
+    def _save_stats(self):
+        # Write-then-rename, so a crash can't leave half a stats file behind
+        with open(self.stats_file + ".tmp", 'w') as f:
+            json.dump(self.stats, f)
+        os.replace(self.stats_file + ".tmp", self.stats_file)
+
+    def __len__(self):
+        return self.stats['total']
+
+    def __iter__(self):
+        """Stream the current archived records back out, one at a time"""
+        index = self._load_index()
+        for internship in self._read_all():
+            entry = index.get(internship['uid'])
+            if entry and entry['stamp'] == record_stamp(internship):
+                yield internship
+
+    def __contains__(self, uid):
+        return uid in self._load_index()
+
+    def entries(self):
+        """uid -> (digest, stamp) for everything archived, the same shape as a sync leaf"""
+        return {uid: (entry['digest'], entry['stamp']) for uid, entry in self._load_index().items()}
+
+    def get(self, uids):
+        """Current copies of some archived records - a full scan, so only sync asks for it"""
+        wanted = set(uids) & set(self._load_index())
+        if not wanted:
+            return {}
+        return {i['uid']: i for i in self if i['uid'] in wanted}
+
+    def append(self, internships):
+        """Archive records, superseding any older archived copy of the same uid"""
+        index = self._load_index()
+        # Same order sync uses to pick a winner: newest stamp, then biggest digest
+        internships = [i for i in internships if i['uid'] not in index or
+                       (index[i['uid']]['stamp'], index[i['uid']]['digest']) < (record_stamp(i), record_digest(i))]
+        if not internships:
+            return
+        
+        with gzip.open(self.path, 'at', encoding='utf-8') as f:
+            for internship in internships:
+                record = {k: v for k, v in internship.items() if k != 'id'}
+                f.write(json.dumps(record) + "\n")
+        with open(self.index_file, 'a') as f:
+            for internship in internships:
+                if internship['uid'] in index:
+                    self._count(index[internship['uid']], -1)
+                entry = self._summary(internship)
+                index[entry['uid']] = entry
+                self._count(entry, 1)
+                f.write(json.dumps(entry) + "\n")
+        self._save_stats()
+
+    def discard(self, uid):
+        """Drop a record from the archive - it was deleted, or it's live again elsewhere"""
+        entry = self._load_index().pop(uid, None)
+        if entry is None:
+            return
+        with open(self.index_file, 'a') as f:
+            f.write(json.dumps({'uid': uid, 'removed': True}) + "\n")
+        self._count(entry, -1)
+        self._save_stats()
+
+
+def is_archivable(internship, cutoff):
+    """Finished and not touched since the cutoff date (YYYY-MM-DD)"""
+    return internship['status'] in TERMINAL_STATUSES and record_stamp(internship)[:10] < cutoff
+
+
+# Files bigger than this are opened read-only and streamed instead of loaded
+STREAMING_THRESHOLD_BYTES = 256 * 1024 * 1024
+STREAM_CHUNK_SIZE = 64 * 1024
+# Most rows a streamed overdue/upcoming list will hold onto
+STREAM_DISPLAY_LIMIT = 50
+# Menu options that only read, so they work while streaming
+STREAMING_MENU_CHOICES = ['2', '3', '7', '8', '14']
+
+
+def iter_json_array(path, chunk_size=STREAM_CHUNK_SIZE, key=None):
+    """Yield the items of a JSON array one at a time.
+
+    The array can be the whole file, or - when `key` is given - the value of
+    that key in a top-level object. Reads the file in chunks and decodes each
+    element as soon as it's complete, so memory stays at roughly one chunk
+    plus one record no matter how big the file gets.
+    """
+    decoder = json.JSONDecoder()
+    with open(path, 'r', encoding='utf-8') as f:
+        buf = ''
+        pos = 0
+        eof = False
+        
+        def skip_spaces():
+            """Move past whitespace, pulling in more data if we run off the end"""
+            nonlocal buf, pos, eof
+            while True:
+                while pos < len(buf) and buf[pos].isspace():
+                    pos += 1
+                if pos < len(buf) or eof:
+                    return
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buf, pos = chunk, 0
+        
+        def decode():
+            """Decode the next value, reading more until it's complete"""
+            nonlocal buf, pos, eof
+            while True:
+                try:
+                    value, end = decoder.raw_decode(buf, pos)
+                    # A bare number cut off by the chunk edge ("2." of "2.5") might keep going
+                    if eof or (end < len(buf) and (isinstance(value, (dict, list, str)) or buf[end] in ',]} \t\r\n')):
+                        pos = end
+                        return value
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buf = buf[pos:] + chunk
+                pos = 0
+        
+        def expect(char):
+            nonlocal pos
+            skip_spaces()
+            if pos >= len(buf) or buf[pos] != char:
+                raise ValueError(f"Expected '{char}' in {path}")
+            pos += 1
+        
+        skip_spaces()
+        if pos >= len(buf):
+            return
+        if key is not None and buf[pos] == '{':
+            # Walk the top-level keys until we reach the array we're after
+            pos += 1
+            after_comma = False
+            while True:
+                skip_spaces()
+                if pos < len(buf) and buf[pos] == '}':
+                    if after_comma:
+                        raise ValueError(f"Trailing comma in {path}")
+                    return
+                name = decode()
+                if not isinstance(name, str):
+                    raise ValueError(f"Expected a key in {path}")
+                expect(':')
+                skip_spaces()
+                if name == key:
+                    break
+                decode()
+                skip_spaces()
+                if pos < len(buf) and buf[pos] == '}':
+                    return
+                expect(',')
+                after_comma = True
+        expect('[')
+        
+        expect_value = True
+        after_comma = False
+        while True:
+            skip_spaces()
+            if pos >= len(buf):
+                raise ValueError(f"{path} ends in the middle of the array")
+            if buf[pos] == ']':
+                # json.load won't take [1,] so neither do we - both modes have to agree on a file
+                if after_comma:
+                    raise ValueError(f"Trailing comma in {path}")
+                return
+            if not expect_value:
+                expect(',')
+                expect_value = after_comma = True
+                continue
+            item = decode()
+            expect_value = after_comma = False
+            yield item
+
+
+def _keep_earliest(heap, limit, key, item):
+    """Hold onto the `limit` smallest-key items using a bounded max-heap (None = keep all)"""
+    heapq.heappush(heap, (tuple(-k for k in key), item))
+    if limit is not None and len(heap) > limit:
+        heapq.heappop(heap)
+
+
+def _earliest_first(heap):
+    return [item for _, item in sorted(heap, key=lambda entry: entry[0], reverse=True)]
+
+
+# Posting enrichment settings
+ENRICH_CACHE_DIR = ".enrich_cache"
+ENRICH_CONCURRENCY = 32
+ENRICH_CONNECTIONS_PER_HOST = 8
+ENRICH_RATE_PER_HOST = 20          # requests per second
+ENRICH_MAX_RETRIES = 3
+ENRICH_BACKOFF = 0.5               # seconds, doubled on each retry
+ENRICH_TIMEOUT = 15
+ENRICH_CACHE_TTL = 24 * 60 * 60    # how long a page without an ETag counts as fresh
+ENRICH_MAX_REDIRECTS = 5
+ENRICH_FIELDS = ['skills', 'stipend', 'deadline', 'duration']
+REDIRECT_STATUSES = [301, 302, 303, 307, 308]
+
+KNOWN_SKILLS = {skill.lower(): skill for skills in ROLE_SKILLS.values() for skill in skills}
+# Longest first so "JavaScript" wins over "Java"; the lookarounds stop "Java" matching inside it
+SKILL_PATTERN = re.compile(
+    r'(?<![\w+#.])(' + '|'.join(re.escape(s) for s in sorted(KNOWN_SKILLS, key=len, reverse=True)) + r')(?![\w+#])',
+    re.IGNORECASE)
+DATE_PATTERN = re.compile(r'(\d{4}-\d{2}-\d{2}|\d{1,2} [A-Za-z]{3,9},? \d{4}|[A-Za-z]{3,9} \d{1,2},? \d{4}|\d{1,2}/\d{1,2}/\d{4})')
+DATE_FORMATS = ["%Y-%m-%d", "%d %B %Y", "%d %b %Y", "%B %d %Y", "%b %d %Y", "%d/%m/%Y"]
+
+
+class FetchError(Exception):
+    """A posting couldn't be fetched, even after retrying"""
+
+
+def _parse_posting_date(text):
+    text = text.replace(',', '')
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    return None
+
+
+def extract_posting_fields(page, url=None):
+    """Default extractor - fishes the fields out of a posting page with regexes.
+
+    Swap in your own callable with the same signature for sites that need it.
+    Only fields it actually found end up in the result.
+    """
+    fields = {}
+    title = re.search(r'<title[^>]*>(.*?)</title>', page, re.IGNORECASE | re.DOTALL)
+    text = re.sub(r'<(script|style)\b.*?</\1>', ' ', page, flags=re.IGNORECASE | re.DOTALL)
+    text = html.unescape(re.sub(r'<[^>]+>', ' ', text))
+    text = re.sub(r'\s+', ' ', text)
+    
+    skills = []
+    for match in SKILL_PATTERN.findall(text):
+        skill = KNOWN_SKILLS[match.lower()]
+        if skill not in skills:
+            skills.append(skill)
+    if skills:
+        fields['skills'] = skills
+    
+    stipend = re.search(r'stipend\W{0,10}(unpaid|(?:₹|rs\.?|inr)?\s*\d[\d,]*)', text, re.IGNORECASE)
+    if stipend:
+        value = stipend.group(1)
+        fields['stipend'] = 'Unpaid' if value.lower() == 'unpaid' else re.sub(r'\D', '', value)
+    
+    duration = (re.search(r'duration\W{0,10}(\d+\s*(?:months?|weeks?))', text, re.IGNORECASE)
+                or re.search(r'\b(\d+\s*months?)\b', text, re.IGNORECASE))
+    if duration:
+        fields['duration'] = duration.group(1)
+    
+    deadline = re.search(r'(?:deadline|apply by|last date(?: to apply)?)\W{0,10}' + DATE_PATTERN.pattern,
+                         text, re.IGNORECASE)
+    if deadline:
+        parsed = _parse_posting_date(deadline.group(1))
+        if parsed:
+            fields['deadline'] = parsed
+    
+    # "Role at Company" or "Role - Company" titles are common enough to be worth a try
+    if title:
+        title_text = html.unescape(re.sub(r'\s+', ' ', title.group(1))).strip()
+        parts = re.split(r'\s+(?:at|-|\|)\s+', title_text, maxsplit=1)
+        if parts[0]:
+            fields['role'] = parts[0]
+        if len(parts) > 1 and parts[1]:
+            fields['company'] = parts[1]
+    
+    return fields
+
+
+def _check_url(url):
+    """Split a URL we're about to fetch, failing straight away if it can't ever work"""
+    parts = urllib.parse.urlsplit(url)
+    if parts.scheme not in ('http', 'https') or not parts.hostname:
+        raise FetchError(f"Not an http(s) URL: {url}")
+    try:
+        parts.port
+    except ValueError as e:
+        raise FetchError(f"Bad URL {url}: {e}") from e
+    return parts
+
+
+class HostRateLimiter:
+    """Spaces out requests to the same host so we stay polite"""
+    def __init__(self, rate=ENRICH_RATE_PER_HOST):
+        self.interval = 1.0 / rate
+        self._next_slot = {}
+
+    async def wait(self, host):
+        now = time.monotonic()
+        slot = max(now, self._next_slot.get(host, now))
+        self._next_slot[host] = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+class ResponseCache:
+    """Fetched pages on disk, keyed by URL, with the ETag to revalidate them"""
+    def __init__(self, directory=ENRICH_CACHE_DIR):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, url):
+        return os.path.join(self.directory, hashlib.sha256(url.encode()).hexdigest() + ".json")
+
+    def get(self, url):
+        try:
+            with open(self._path(url), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        return entry if entry.get('url') == url else None
+
+    def put(self, url, etag, body):
+        path = self._path(url)
+        with open(path + ".tmp", 'w', encoding='utf-8') as f:
+            json.dump({'url': url, 'etag': etag, 'fetched_at': time.time(), 'body': body}, f)
+        os.replace(path + ".tmp", path)
+
+
+class HTTPPool:
+    """Tiny keep-alive HTTP/1.1 client on top of asyncio streams.
+
+    Idle connections are kept per host and reused, with a cap on how many
+    can be open to one host at a time.
+    """
+    def __init__(self, per_host=ENRICH_CONNECTIONS_PER_HOST, timeout=ENRICH_TIMEOUT):
+        self.per_host = per_host
+        self.timeout = timeout
+        self._idle = {}
+        self._slots = {}
+        self._ssl = ssl.create_default_context()
+        self.connections_opened = 0
+
+    async def request(self, url, headers):
+        """GET a URL, returning (status, headers, body bytes)"""
+        parts = _check_url(url)
+        port = parts.port or (443 if parts.scheme == 'https' else 80)
+        key = (parts.scheme, parts.hostname, port)
+        path = (parts.path or '/') + (f"?{parts.query}" if parts.query else '')
+        
+        async with self._slots.setdefault(key, asyncio.Semaphore(self.per_host)):
+            idle = self._idle.setdefault(key, [])
+            while True:
+                reused = bool(idle)
+                if reused:
+                    reader, writer = idle.pop()
+                else:
+                    reader, writer = await asyncio.wait_for(
+                        asyncio.open_connection(parts.hostname, port,
+                                                ssl=self._ssl if parts.scheme == 'https' else None),
+                        self.timeout)
+                    self.connections_opened += 1
+                try:
+                    status, response_headers, body, keep_alive = await asyncio.wait_for(
+                        self._exchange(reader, writer, parts.hostname, port, path, headers), self.timeout)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    writer.close()
+                    if reused:
+                        # The server dropped an idle connection - just try a fresh one
+                        continue
+                    raise
+                except BaseException:
+                    writer.close()
+                    raise
+                
+                if keep_alive:
+                    idle.append((reader, writer))
+                else:
+                    writer.close()
+                return status, response_headers, body
+
+    async def _exchange(self, reader, writer, host, port, path, headers):
+        host_header = host if port in (80, 443) else f"{host}:{port}"
+        lines = [f"GET {path} HTTP/1.1", f"Host: {host_header}", "User-Agent: internship-tracker",
+                 "Accept-Encoding: identity", "Connection: keep-alive"]
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode('latin-1'))
+        await writer.drain()
+        
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError("Connection closed before a response")
+        version, status = status_line.decode('latin-1').split(None, 2)[:2]
+        status = int(status)
+        response_headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            response_headers[name.strip().lower()] = value.strip()
+        
+        keep_alive = version == 'HTTP/1.1' and response_headers.get('connection', '').lower() != 'close'
+        if status in (204, 304) or 100 <= status < 200:
+            body = b''
+        elif response_headers.get('transfer-encoding', '').lower() == 'chunked':
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b';')[0].strip(), 16)
+                if size == 0:
+                    # Skip any trailers
+                    while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                        pass
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            body = b''.join(chunks)
+        elif 'content-length' in response_headers:
+            body = await reader.readexactly(int(response_headers['content-length']))
+        else:
+            body = await reader.read()
+            keep_alive = False
+        return status, response_headers, body, keep_alive
+
+    def close(self):
+        for connections in self._idle.values():
+            for _, writer in connections:
+                writer.close()
+        self._idle = {}
+
+
+class PostingFetcher:
+    """Fetches posting pages with caching, per-host rate limits and retries"""
+    def __init__(self, cache_dir=ENRICH_CACHE_DIR, retries=ENRICH_MAX_RETRIES):
+        self.pool = HTTPPool()
+        self.cache = ResponseCache(cache_dir)
+        self.limiter = HostRateLimiter()
+        self.retries = retries
+        self.stats = Counter()
+
+    async def fetch(self, url):
+        cached = self.cache.get(url)
+        if cached and not cached.get('etag') and time.time() - cached['fetched_at'] < ENRICH_CACHE_TTL:
+            self.stats['cached'] += 1
+            return cached['body']
+        
+        # A malformed URL won't get any better by retrying it
+        target = url
+        host = _check_url(target).hostname
+        headers = {'If-None-Match': cached['etag']} if cached and cached.get('etag') else {}
+        attempt = 0
+        redirects = 0
+        while True:
+            await self.limiter.wait(host)
+            retry_after = None
+            try:
+                status, response_headers, body = await self.pool.request(target, headers)
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError) as e:
+                error = f"{type(e).__name__}: {e}"
+            else:
+                if status == 304 and cached:
+                    self.stats['revalidated'] += 1
+                    return cached['body']
+                if status == 200:
+                    charset = re.search(r'charset=([\w-]+)', response_headers.get('content-type', ''))
+                    try:
+                        page = body.decode(charset.group(1) if charset else 'utf-8', errors='replace')
+                    except LookupError:
+                        page = body.decode('utf-8', errors='replace')
+                    self.cache.put(url, response_headers.get('etag'), page)
+                    self.stats['fetched'] += 1
+                    return page
+                if status in REDIRECT_STATUSES and 'location' in response_headers:
+                    redirects += 1
+                    if redirects > ENRICH_MAX_REDIRECTS:
+                        raise FetchError(f"Too many redirects for {url}")
+                    target = urllib.parse.urljoin(target, response_headers['location'])
+                    host = _check_url(target).hostname
+                    continue
+                if status != 429 and status < 500:
+                    raise FetchError(f"HTTP {status} for {url}")
+                error = f"HTTP {status}"
+                if response_headers.get('retry-after', '').isdigit():
+                    retry_after = int(response_headers['retry-after'])
+            
+            attempt += 1
+            self.stats['retries'] += 1
+            if attempt > self.retries:
+                raise FetchError(f"Gave up on {url} after {attempt} tries ({error})")
+            # Exponential backoff with jitter so workers don't all come back at once
+            delay = ENRICH_BACKOFF * 2 ** (attempt - 1) * (1 + random.random())
+            await asyncio.sleep(retry_after if retry_after is not None else delay)
+
+    def close(self):
+        self.pool.close()
+
+
+async def enrich_urls(urls, extractor=extract_posting_fields, concurrency=ENRICH_CONCURRENCY,
+                      cache_dir=ENRICH_CACHE_DIR):
+    """Fetch every URL through a pool of workers and run the extractor on each page.
+
+    Returns ({url: fields or FetchError}, fetch stats).
+    """
+    fetcher = PostingFetcher(cache_dir)
+    queue = asyncio.Queue()
+    for url in urls:
+        queue.put_nowait(url)
+    results = {}
+    
+    async def worker():
+        while not queue.empty():
+            url = queue.get_nowait()
+            try:
+                page = await fetcher.fetch(url)
+            except FetchError as e:
+                results[url] = e
+                continue
+            # One odd page shouldn't take the rest of the batch down with it
+            try:
+                results[url] = extractor(page, url)
+            except Exception as e:
+                results[url] = FetchError(f"Couldn't read the posting at {url} ({type(e).__name__}: {e})")
+    
+    try:
+        await asyncio.gather(*(worker() for _ in range(min(concurrency, len(urls)))))
+    finally:
+        fetcher.close()
+    fetcher.stats['connections'] = fetcher.pool.connections_opened
+    return results, fetcher.stats
+
+
+# On-disk schema - bump CURRENT_SCHEMA_VERSION and add to MIGRATIONS when the record shape changes
+CURRENT_SCHEMA_VERSION = 2
+MIGRATION_CHECKPOINT_EVERY = 10000
+STATUSES = ['Not Applied', 'Applied', 'Interview Scheduled', 'Interview Completed',
+            'Accepted', 'Rejected', 'Withdrawn']
+TEXT_FIELDS = ['company', 'role', 'location', 'stipend', 'duration', 'notes', 'url']
+
+
+class DataFileError(ValueError):
+    """A data file we can't read or upgrade - it's left exactly as it was"""
+
+
+def _valid_date(value):
+    try:
+        datetime.strptime(value, "%Y-%m-%d")
+        return True
+    except (TypeError, ValueError):
+        return False
+
+
+def legacy_identity(internship):
+    """What makes a pre-uid record itself: who, what and when, never its position.
+
+    Ids get renumbered whenever something is deleted, so two copies of the
+    same old file can disagree on them - the content doesn't.
+    """
+    return '|'.join(str(internship.get(field) or '').strip()
+                    for field in ('company', 'role', 'date_added'))
+
+
+def normalize_record(internship, occurrence=0):
+    """Give a record the full v2 shape: every field present, with the right type.
+
+    Statuses match regardless of case. A status, date added or deadline we
+    can't make sense of gets moved into the notes instead of silently dropped,
+    and missing dates fall back to today so nothing downstream has to second-guess them.
+    Records without a uid get one from legacy_identity(); `occurrence` says how
+    many earlier records in the file share it, so exact duplicates stay apart.
+    """
+    record = dict(internship)
+    identity = legacy_identity(internship)
+    for field in TEXT_FIELDS:
+        value = record.get(field)
+        record[field] = '' if value is None else str(value)
+    
+    skills = record.get('skills') or []
+    if isinstance(skills, str):
+        skills = skills.split(',')
+    record['skills'] = [str(s).strip() for s in skills if str(s).strip()]
+    
+    status = str(record.get('status') or '').strip()
+    known = {s.lower(): s for s in STATUSES}
+    if status.lower() in known:
+        record['status'] = known[status.lower()]
+    else:
+        if status:
+            record['notes'] = f"{record['notes']} (status was: {status})".strip()
+        record['status'] = 'Not Applied'
+    
+    date_added = record.get('date_added') or ''
+    if not _valid_date(date_added):
+        if date_added:
+            record['notes'] = f"{record['notes']} (date added was: {date_added})".strip()
+        record['date_added'] = datetime.now().strftime("%Y-%m-%d")
+    
+    deadline = record.get('deadline') or ''
+    if deadline and not _valid_date(deadline):
+        record['notes'] = f"{record['notes']} (deadline was: {deadline})".strip()
+        deadline = ''
+    record['deadline'] = deadline
+    
+    if not record.get('last_updated'):
+        record['last_updated'] = record['date_added'] + " 00:00:00"
+    if not record.get('uid'):
+        record['uid'] = uuid.uuid5(uuid.NAMESPACE_URL, f"{identity}|{occurrence}").hex
+    return record
+
+
+def _migrate_v1(internship, context):
+    """v1 was a bare list of loosely shaped records"""
+    record = normalize_record(internship, context['occurrence'])
+    record['id'] = context['position'] + 1
+    return record
+
+
+# version -> function that upgrades one record from that version to the next.
+# Each gets the record plus a context dict: its 'position' in the file and its
+# 'occurrence' - how many earlier records have the same legacy_identity().
+MIGRATIONS = {
+    1: _migrate_v1,
+}
+
+
+def read_schema_version(path):
+    """Peek at a data file's version - v1 files are just a bare list"""
+    with open(path, 'r', encoding='utf-8') as f:
+        head = f.read(4096).lstrip()
+    if not head or head.startswith('['):
+        return 1
+    match = re.match(r'\{\s*"schema_version"\s*:\s*(\d+)', head)
+    if not match:
+        raise ValueError(f"Can't tell which schema version {path} is")
+    return int(match.group(1))
+
+
+def migrate_data_file(path, progress=None):
+    """Upgrade a data file to the current schema, one record at a time.
+
+    The new file is written next to the old one and swapped in at the end.
+    Every MIGRATION_CHECKPOINT_EVERY records the output is synced and a
+    checkpoint saved, so if we get interrupted the next run keeps what's
+    already written and picks up where it left off. Returns how many records
+    were migrated.
+    """
+    version = read_schema_version(path)
+    if version > CURRENT_SCHEMA_VERSION:
+        raise ValueError(f"{path} is schema v{version} - this version only knows up to v{CURRENT_SCHEMA_VERSION}")
+    if version == CURRENT_SCHEMA_VERSION:
+        return 0
+    
+    steps = [MIGRATIONS[v] for v in range(version, CURRENT_SCHEMA_VERSION)]
+    temp_file = path + ".migrating"
+    checkpoint_file = path + ".migrating.json"
+    stat = os.stat(path)
+    source = {'version': version, 'size': stat.st_size, 'mtime': stat.st_mtime}
+    
+    done = 0
+    written = 0
+    if os.path.exists(checkpoint_file) and os.path.exists(temp_file):
+        with open(checkpoint_file, 'r') as f:
+            checkpoint = json.load(f)
+        # Only resume if the source file hasn't changed under us
+        if checkpoint['source'] == source:
+            done = checkpoint['records_done']
+            written = checkpoint['bytes_written']
+    
+    def save_checkpoint(records_done, bytes_written):
+        with open(checkpoint_file + ".tmp", 'w') as f:
+            json.dump({'source': source, 'records_done': records_done, 'bytes_written': bytes_written}, f)
+        os.replace(checkpoint_file + ".tmp", checkpoint_file)
+    
+    try:
+        with open(temp_file, 'r+b' if written else 'wb') as out:
+            if written:
+                out.seek(written)
+                out.truncate()
+            else:
+                out.write(f'{{\n    "schema_version": {CURRENT_SCHEMA_VERSION},\n    "internships": ['.encode())
+            
+            count = 0
+            seen = Counter()
+            for position, record in enumerate(iter_json_array(path, key='internships')):
+                count = position + 1
+                # Counted for skipped records too, so a resumed run hands out the same uids
+                identity = legacy_identity(record)
+                context = {'position': position, 'occurrence': seen[identity]}
+                seen[identity] += 1
+                if position < done:
+                    continue
+                for step in steps:
+                    record = step(record, context)
+                body = json.dumps(record, indent=4).replace('\n', '\n        ')
+                out.write(f"{',' if position else ''}\n        {body}".encode())
+                
+                if count % MIGRATION_CHECKPOINT_EVERY == 0:
+                    out.flush()
+                    os.fsync(out.fileno())
+                    save_checkpoint(count, out.tell())
+                    if progress:
+                        progress(count)
+            
+            out.write(b'\n    ]\n}\n')
+            out.flush()
+            os.fsync(out.fileno())
+    except (ValueError, TypeError, AttributeError) as e:
+        # The source itself is broken, so a resume would only hit the same spot - start clean next time
+        for leftover in (temp_file, checkpoint_file):
+            if os.path.exists(leftover):
+                os.remove(leftover)
+        raise DataFileError(f"it isn't valid tracker data ({e})") from e
+    
+    os.replace(temp_file, path)
+    if os.path.exists(checkpoint_file):
+        os.remove(checkpoint_file)
+    return count
+
+
+class InternshipTracker:
+    def __init__(self, data_file=DATA_FILE, archive_after_days=ARCHIVE_AFTER_DAYS, include_archived=False,
+                 streaming=None):
+        self.data_file = data_file
+        self.archive_after_days = archive_after_days
+        self.include_archived = include_archived
+        self.archive = ColdArchive(self.data_file)
+        
+        # Older files get upgraded to the current schema first (resumes if it got interrupted)
+        try:
+            if os.path.exists(data_file) and read_schema_version(data_file) < CURRENT_SCHEMA_VERSION:
+                print(f"\n🔧 Upgrading {data_file} to schema v{CURRENT_SCHEMA_VERSION}...")
+                migrated = migrate_data_file(data_file, progress=lambda n: print(f"   {n} records done..."))
+                print(f"✓ Upgraded {migrated} record(s)")
+        except ValueError as e:
+            raise DataFileError(f"Couldn't upgrade {data_file}: {e}. The file hasn't been touched - "
+                                "fix or move it, then start the tracker again.") from e
+        
+        # Huge files get streamed read-only rather than loaded into memory
+        if streaming is None:
+            streaming = os.path.exists(data_file) and os.path.getsize(data_file) > STREAMING_THRESHOLD_BYTES
+        self.streaming = streaming
+        self.internships = [] if streaming else self.load_data()
+        
+        # Move finished applications out of the way before anything else looks at them
+        if not streaming:
+            self._archive_old_records()
+        
+        # Things that want to hear about every add/edit/delete
+        self.query_engine = QueryEngine()
+        self.advisor_view = AdvisorView()
+        self.sync = SyncReplica(self)
+        self.listeners = [self.query_engine, self.advisor_view, self.sync]
+        self.reminders = None
+        self.reminder_state_file = os.path.splitext(data_file)[0] + ".reminders.json"
+        # Turns a fetched posting page into fields - swap it for site-specific extractors
+        self.extractor = extract_posting_fields
+    
+    def _record_changed(self, internship):
+        """Tell everyone listening that a record was added or edited"""
+        for listener in self.listeners:
+            listener.record_changed(internship)
+    
+    def _record_removed(self, internship):
+        """Tell everyone listening that a record is gone"""
+        for listener in self.listeners:
+            listener.record_removed(internship)
+    
+    def _remove_record(self, internship):
+        """Drop a record and renumber the rest so ids stay 1..n"""
+        self.internships.remove(internship)
+        for idx, intern in enumerate(self.internships, 1):
+            intern['id'] = idx
+        self._record_removed(internship)
+    
+    def archive_cutoff(self):
+        return (datetime.now() - timedelta(days=self.archive_after_days)).strftime("%Y-%m-%d")
+    
+    def _archive_old_records(self):
+        """Tier off accepted/rejected/withdrawn records nobody has touched in a while"""
+        cutoff = self.archive_cutoff()
+        old = [i for i in self.internships if is_archivable(i, cutoff)]
+        if not old:
+            return
+        self.archive.append(old)
+        self.internships = [i for i in self.internships if not is_archivable(i, cutoff)]
+        for idx, intern in enumerate(self.internships, 1):
+            intern['id'] = idx
+        self.save_data()
+    
+    def _records(self):
+        """Every active record - straight off disk in streaming mode, otherwise from memory"""
+        if self.streaming:
+            return iter_json_array(self.data_file, key='internships')
+        return self.internships
+    
+    def _has_records(self):
+        return self.streaming or bool(self.internships)
     
     def load_data(self):
         """Grab all the internship data from our JSON file"""
-        if os.path.exists(DATA_FILE):
-            try:
-                with open(DATA_FILE, 'r') as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
-                return []
-        return []
+        if not os.path.exists(self.data_file):
+            return []
+        # Starting empty would mean the next save wipes the file, so refuse instead
+        try:
+            with open(self.data_file, 'r') as f:
+                data = json.load(f)
+        except ValueError as e:
+            raise DataFileError(f"{self.data_file} isn't valid JSON ({e}). The file hasn't been touched - "
+                                "fix it or restore a backup, then start the tracker again.") from e
+        if not isinstance(data, dict) or not isinstance(data.get('internships'), list):
+            raise DataFileError(f"{self.data_file} has no 'internships' list. The file hasn't been touched - "
+                                "fix it or restore a backup, then start the tracker again.")
+        return data['internships']
     
     def save_data(self):
         """Save all our internship data - don't wanna lose anything!"""
-        with open(DATA_FILE, 'w') as f:
-            json.dump(self.internships, f, indent=4)
+        with open(self.data_file, 'w') as f:
+            json.dump({'schema_version': CURRENT_SCHEMA_VERSION, 'internships': self.internships}, f, indent=4)
     
     def add_internship(self):
         """Time to add a new internship to track!"""
@@ -47,6 +2269,7 @@ class InternshipTracker:
         
         internship = {}
         internship['id'] = len(self.internships) + 1
+        internship['uid'] = uuid.uuid4().hex
         internship['company'] = input("Company Name: ").strip()
         internship['role'] = input("Role/Position: ").strip()
         internship['location'] = input("Location: ").strip()
@@ -75,16 +2298,19 @@ class InternshipTracker:
             internship['deadline'] = ""
         
         internship['notes'] = input("Notes (optional): ").strip()
+        internship['url'] = ''
+        internship['last_updated'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
         self.internships.append(internship)
         self.save_data()
+        self._record_changed(internship)
         
         print("\n✓ Internship added successfully!")
         print(f"ID: {internship['id']} - {internship['role']} at {internship['company']}")
     
     def view_all_internships(self):
         """Let's see everything you've got saved!"""
-        if not self.internships:
+        if not self._has_records():
             print("\n❌ No internships found. Add some first!")
             return
         
@@ -92,7 +2318,8 @@ class InternshipTracker:
         print("ALL INTERNSHIPS")
         print("="*100)
         
-        for internship in self.internships:
+        today = datetime.now().date()
+        for internship in self._records():
             print(f"\nID: {internship['id']}")
             print(f"Company: {internship['company']}")
             print(f"Role: {internship['role']}")
@@ -102,22 +2329,18 @@ class InternshipTracker:
             print(f"Skills: {', '.join(internship['skills'])}")
             print(f"Status: {internship['status']}")
             print(f"Date Added: {internship['date_added']}")
-            if internship.get('deadline'):
+            if internship['deadline']:
                 deadline_str = internship['deadline']
-                try:
-                    deadline_date = datetime.strptime(deadline_str, "%Y-%m-%d")
-                    days_left = (deadline_date - datetime.now()).days
-                    if days_left < 0:
-                        print(f"Deadline: {deadline_str} ⚠️ OVERDUE by {abs(days_left)} days")
-                    elif days_left == 0:
-                        print(f"Deadline: {deadline_str} 🔥 TODAY!")
-                    elif days_left <= 3:
-                        print(f"Deadline: {deadline_str} ⏰ {days_left} days left")
-                    else:
-                        print(f"Deadline: {deadline_str} ({days_left} days left)")
-                except:
-                    print(f"Deadline: {deadline_str}")
-            if internship.get('notes'):
+                days_left = days_until(deadline_str, today)
+                if days_left < 0:
+                    print(f"Deadline: {deadline_str} ⚠️ OVERDUE by {abs(days_left)} days")
+                elif days_left == 0:
+                    print(f"Deadline: {deadline_str} 🔥 TODAY!")
+                elif days_left <= 3:
+                    print(f"Deadline: {deadline_str} ⏰ {days_left} days left")
+                else:
+                    print(f"Deadline: {deadline_str} ({days_left} days left)")
+            if internship['notes']:
                 print(f"Notes: {internship['notes']}")
             print("-" * 100)
     
@@ -144,17 +2367,16 @@ class InternshipTracker:
                 return
             
             print("\nStatus Options:")
-            statuses = ['Not Applied', 'Applied', 'Interview Scheduled', 'Interview Completed', 
-                       'Accepted', 'Rejected', 'Withdrawn']
-            for idx, status in enumerate(statuses, 1):
+            for idx, status in enumerate(STATUSES, 1):
                 print(f"{idx}. {status}")
             
             choice = int(input("\nSelect status (1-7): "))
-            if 1 <= choice <= len(statuses):
+            if 1 <= choice <= len(STATUSES):
                 old_status = internship['status']
-                internship['status'] = statuses[choice - 1]
+                internship['status'] = STATUSES[choice - 1]
                 internship['last_updated'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 self.save_data()
+                self._record_changed(internship)
                 print(f"\n✓ Status updated from '{old_status}' to '{internship['status']}'")
             else:
                 print("❌ Invalid choice!")
@@ -164,7 +2386,8 @@ class InternshipTracker:
     
     def show_statistics(self):
         """Let's crunch some numbers and see how you're doing!"""
-        if not self.internships:
+        archived = self.archive.stats
+        if not self._has_records() and not archived['total']:
             print("\n❌ No internships found. Add some first!")
             return
         
@@ -172,27 +2395,41 @@ class InternshipTracker:
         print("INTERNSHIP STATISTICS")
         print("="*50)
         
-        # intrenships enrolled
-        print(f"\n📊 Total Internships: {len(self.internships)}")
+        # One pass over the active records - works the same whether they're in memory or streamed
+        active = 0
+        status_count = Counter()
+        company_count = Counter()
+        skill_count = Counter()
+        for internship in self._records():
+            active += 1
+            status_count[internship['status']] += 1
+            company_count[internship['company']] += 1
+            skill_count.update(internship['skills'])
+        
+        # intrenships enrolled - archived ones come from their precomputed totals
+        total = active + archived['total']
+        if not total:
+            print("\n❌ No internships found. Add some first!")
+            return
+        print(f"\n📊 Total Internships: {total}")
+        if archived['total']:
+            print(f"   ({active} active, {archived['total']} archived)")
         
         
-        status_count = Counter(i['status'] for i in self.internships)
+        status_count += Counter(archived['status'])
         print("\n📈 Status Breakdown:")
         for status, count in status_count.items():
-            percentage = (count / len(self.internships)) * 100
+            percentage = (count / total) * 100
             print(f"   {status}: {count} ({percentage:.1f}%)")
         
         # internship interests
-        company_count = Counter(i['company'] for i in self.internships)
+        company_count += Counter(archived['companies'])
         print("\n🏢 Top Companies:")
         for company, count in company_count.most_common(5):
             print(f"   {company}: {count}")
         
         # trending skills
-        all_skills = []
-        for internship in self.internships:
-            all_skills.extend(internship['skills'])
-        skill_count = Counter(all_skills)
+        skill_count += Counter(archived['skills'])
         print("\n💡 Most Required Skills:")
         for skill, count in skill_count.most_common(10):
             print(f"   {skill}: {count}")
@@ -286,7 +2523,7 @@ class InternshipTracker:
     
     def search_filter(self):
         """Looking for something specific? Let's find it!"""
-        if not self.internships:
+        if not self._has_records() and not (self.include_archived and len(self.archive)):
             print("\n❌ No internships found. Add some first!")
             return
         
@@ -298,104 +2535,166 @@ class InternshipTracker:
         print("3. Filter by Status")
         print("4. Filter by Location")
         print("5. Search by Skill")
-        print("6. Show Upcoming Deadlines")
-        print("7. Back to Main Menu")
+        print("6. Query (combine filters)")
+        print("7. Explain a Query")
+        print("8. Show Upcoming Deadlines")
+        print("9. Back to Main Menu")
         
-        choice = input("\nEnter your choice (1-7): ").strip()
+        choice = input("\nEnter your choice (1-9): ").strip()
         
         results = []
+        matches = None
         
         if choice == '1':
             search_term = input("\nEnter company name: ").strip().lower()
-            results = [i for i in self.internships if search_term in i['company'].lower()]
+            matches = lambda i: search_term in i['company'].lower()
         
         elif choice == '2':
             search_term = input("\nEnter role/position: ").strip().lower()
-            results = [i for i in self.internships if search_term in i['role'].lower()]
+            matches = lambda i: search_term in i['role'].lower()
         
         elif choice == '3':
             print("\nStatuses: Not Applied, Applied, Interview Scheduled, Interview Completed, Accepted, Rejected, Withdrawn")
             status = input("Enter status: ").strip()
-            results = [i for i in self.internships if i['status'].lower() == status.lower()]
+            matches = lambda i: i['status'].lower() == status.lower()
         
         elif choice == '4':
             location = input("\nEnter location: ").strip().lower()
-            results = [i for i in self.internships if location in i['location'].lower()]
+            matches = lambda i: location in i['location'].lower()
         
         elif choice == '5':
             skill = input("\nEnter skill: ").strip().lower()
-            results = [i for i in self.internships if any(skill in s.lower() for s in i['skills'])]
+            matches = lambda i: any(skill in s.lower() for s in i['skills'])
+        
+        elif choice in ('6', '7'):
+            print("\nCombine filters with & (and), | (or), ! (not) and parentheses.")
+            print("Operators: = exact, != not, ~ contains, : has skill, < <= > >= for deadline/added/stipend")
+            print("Dates can be today, +10d, -2w or YYYY-MM-DD")
+            print("e.g. status=Applied & location~bangalore & deadline<+10d & skill:python")
+            print("Add --include-archived to search archived records too")
+            query = input("\nQuery: ").strip()
+            include_archived = self.include_archived
+            if query.endswith('--include-archived'):
+                query = query[:-len('--include-archived')].strip()
+                include_archived = True
+            if not query:
+                print("❌ No query entered!")
+                return
+            archived = self.archive if include_archived else None
+            try:
+                if self.streaming:
+                    records = itertools.chain(self._records(), archived or [])
+                    if choice == '7':
+                        explanation = self.query_engine.explain_scan(query, records)
+                    else:
+                        results = self.query_engine.scan(query, records)
+                elif choice == '7':
+                    explanation = self.query_engine.explain(query, self.internships, archived)
+                else:
+                    results = self.query_engine.run(query, self.internships, archived)
+            except QueryError as e:
+                print(f"❌ Invalid query: {e}")
+                return
+            if choice == '7':
+                print()
+                for line in explanation:
+                    print(line)
+                return
         
-        elif choice == '6':
+        elif choice == '8':
             self.show_upcoming_deadlines()
             return
         
-        elif choice == '7':
+        elif choice == '9':
             return
         
         else:
             print("❌ Invalid choice!")
             return
         
+        if matches:
+            results = (i for i in self._records() if matches(i))
+            if self.include_archived:
+                results = itertools.chain(results, (i for i in self.archive if matches(i)))
+            if not self.streaming:
+                results = list(results)
+        
+        if self.streaming:
+            # Print matches as they stream past so nothing piles up in memory
+            found = 0
+            for internship in results:
+                if not found:
+                    print("\n" + "=" * 100)
+                found += 1
+                self._print_search_result(internship)
+            if found:
+                print(f"\n✓ Found {found} matching internship(s)")
+            else:
+                print("\n❌ No matching internships found!")
+            return
         
         if results:
             print(f"\n✓ Found {len(results)} matching internship(s):\n")
             print("=" * 100)
             for internship in results:
-                print(f"\nID: {internship['id']}")
-                print(f"Company: {internship['company']}")
-                print(f"Role: {internship['role']}")
-                print(f"Location: {internship['location']}")
-                print(f"Stipend: {internship['stipend']}")
-                print(f"Duration: {internship['duration']}")
-                print(f"Skills: {', '.join(internship['skills'])}")
-                print(f"Status: {internship['status']}")
-                print(f"Date Added: {internship['date_added']}")
-                if internship.get('deadline'):
-                    print(f"Deadline: {internship['deadline']}")
-                if internship.get('notes'):
-                    print(f"Notes: {internship['notes']}")
-                print("-" * 100)
+                self._print_search_result(internship)
         else:
             print("\n❌ No matching internships found!")
     
+    def _print_search_result(self, internship):
+        print(f"\nID: {internship.get('id', '(archived)')}")
+        print(f"Company: {internship['company']}")
+        print(f"Role: {internship['role']}")
+        print(f"Location: {internship['location']}")
+        print(f"Stipend: {internship['stipend']}")
+        print(f"Duration: {internship['duration']}")
+        print(f"Skills: {', '.join(internship['skills'])}")
+        print(f"Status: {internship['status']}")
+        print(f"Date Added: {internship['date_added']}")
+        if internship['deadline']:
+            print(f"Deadline: {internship['deadline']}")
+        if internship['notes']:
+            print(f"Notes: {internship['notes']}")
+        print("-" * 100)
+    
     def show_upcoming_deadlines(self):
         """Don't miss those deadlines! Let's see what's coming up"""
         print("\n" + "="*50)
         print("UPCOMING DEADLINES")
         print("="*50)
         
-        # Filtering deadline internships
-        internships_with_deadlines = [i for i in self.internships if i.get('deadline')]
+        # One pass: bucket every deadline, keeping just the earliest ones per bucket.
+        # In memory we keep everything; streaming caps the lists so memory stays flat.
+        today = datetime.now().date()
+        limit = STREAM_DISPLAY_LIMIT if self.streaming else None
+        buckets = {'overdue': [], 'upcoming': [], 'future': []}
+        counts = Counter()
+        with_deadlines = 0
         
-        if not internships_with_deadlines:
+        for seq, internship in enumerate(self._records()):
+            if not internship['deadline']:
+                continue
+            with_deadlines += 1
+            days_left = days_until(internship['deadline'], today)
+            
+            if days_left < 0:
+                bucket, bucket_limit = 'overdue', limit
+            elif days_left <= 7:
+                bucket, bucket_limit = 'upcoming', limit
+            else:
+                # Just showing the first 5 to keep it clean
+                bucket, bucket_limit = 'future', 5
+            counts[bucket] += 1
+            _keep_earliest(buckets[bucket], bucket_limit, (days_left, seq), (internship, days_left))
+        
+        if not with_deadlines:
             print("\n❌ No internships with deadlines set!")
             return
         
         # Sorting by date so we see the urgent ones first
-        try:
-            internships_with_deadlines.sort(key=lambda x: datetime.strptime(x['deadline'], "%Y-%m-%d"))
-        except:
-            pass
-        
-        today = datetime.now()
-        overdue = []
-        upcoming = []
-        future = []
-        
-        for internship in internships_with_deadlines:
-            try:
-                deadline_date = datetime.strptime(internship['deadline'], "%Y-%m-%d")
-                days_left = (deadline_date - today).days
-                
-                if days_left < 0:
-                    overdue.append((internship, days_left))
-                elif days_left <= 7:
-                    upcoming.append((internship, days_left))
-                else:
-                    future.append((internship, days_left))
-            except:
-                continue
+        overdue = _earliest_first(buckets['overdue'])
+        upcoming = _earliest_first(buckets['upcoming'])
+        future = _earliest_first(buckets['future'])
         
         # deadlines
         if overdue:
@@ -405,6 +2704,8 @@ class InternshipTracker:
                 print(f"   Deadline: {internship['deadline']} (Overdue by {abs(days)} days)")
                 print(f"   Status: {internship['status']}")
                 print()
+            if counts['overdue'] > len(overdue):
+                print(f"   ...and {counts['overdue'] - len(overdue)} more")
         
         # upcoming ones
         if upcoming:
@@ -415,11 +2716,13 @@ class InternshipTracker:
                 print(f"   Deadline: {internship['deadline']} ({urgency})")
                 print(f"   Status: {internship['status']}")
                 print()
+            if counts['upcoming'] > len(upcoming):
+                print(f"   ...and {counts['upcoming'] - len(upcoming)} more")
         
         # furutre deadlines
         if future:
             print("\n📅 FUTURE DEADLINES:")
-            for internship, days in future[:5]:  # Just showing the first 5 to keep it clean
+            for internship, days in future:
                 print(f"   ID {internship['id']}: {internship['role']} at {internship['company']}")
                 print(f"   Deadline: {internship['deadline']} ({days} days left)")
                 print(f"   Status: {internship['status']}")
@@ -492,7 +2795,7 @@ class InternshipTracker:
                     internship['skills'] = [skill.strip() for skill in new_value.split(',') if skill.strip()]
             
             elif choice == '7':
-                current_deadline = internship.get('deadline', 'Not set')
+                current_deadline = internship['deadline'] or 'Not set'
                 new_value = input(f"Current Deadline: {current_deadline}\nNew Deadline (YYYY-MM-DD): ").strip()
                 if new_value:
                     try:
@@ -503,7 +2806,7 @@ class InternshipTracker:
                         return
             
             elif choice == '8':
-                current_notes = internship.get('notes', 'None')
+                current_notes = internship['notes'] or 'None'
                 new_value = input(f"Current Notes: {current_notes}\nNew Notes: ").strip()
                 internship['notes'] = new_value
             
@@ -517,6 +2820,7 @@ class InternshipTracker:
             
             internship['last_updated'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             self.save_data()
+            self._record_changed(internship)
             print("\n✓ Internship updated successfully!")
         
         except ValueError:
@@ -550,10 +2854,7 @@ class InternshipTracker:
             confirm = input("\nType 'yes' to confirm: ").strip().lower()
             
             if confirm == 'yes':
-                self.internships.remove(internship)
-                
-                for idx, intern in enumerate(self.internships, 1):
-                    intern['id'] = idx
+                self._remove_record(internship)
                 self.save_data()
                 print("\n✓ Internship deleted successfully!")
             else:
@@ -573,108 +2874,12 @@ class InternshipTracker:
         print("="*60)
         print("\nAnalyzing your internships and generating recommendations...\n")
         
-        # Calculate scores for each internship
-        scored_internships = []
-        
-        for internship in self.internships:
-            score = 0
-            reasons = []
-            
-            # Skip if already accepted or rejected
-            if internship['status'] in ['Accepted', 'Rejected']:
-                continue
-            
-            # Factor 1: Deadline urgency (0-30 points)
-            if internship.get('deadline'):
-                try:
-                    deadline_date = datetime.strptime(internship['deadline'], "%Y-%m-%d")
-                    days_left = (deadline_date - datetime.now()).days
-                    
-                    if days_left < 0:
-                        score += 5
-                        reasons.append("⚠️ Overdue - apply ASAP if still interested")
-                    elif days_left == 0:
-                        score += 30
-                        reasons.append("🔥 Deadline is TODAY - urgent!")
-                    elif days_left <= 3:
-                        score += 25
-                        reasons.append(f"⏰ Only {days_left} days left - very urgent")
-                    elif days_left <= 7:
-                        score += 20
-                        reasons.append(f"📌 {days_left} days left - should apply soon")
-                    elif days_left <= 14:
-                        score += 15
-                        reasons.append(f"📅 {days_left} days left - good time to apply")
-                    else:
-                        score += 10
-                except:
-                    pass
-            
-            # Factor 2: Application status (0-25 points)
-            if internship['status'] == 'Not Applied':
-                score += 25
-                reasons.append("✨ Haven't applied yet - fresh opportunity")
-            elif internship['status'] == 'Applied':
-                score += 15
-                reasons.append("📬 Already applied - might want to follow up")
-            elif internship['status'] == 'Interview Scheduled':
-                score += 30
-                reasons.append("💼 Interview coming up - prep time!")
-            elif internship['status'] == 'Interview Completed':
-                score += 20
-                reasons.append("🤞 Waiting for response - consider follow-up")
-            
-            # Factor 3: Skill requirements (0-20 points)
-            if len(internship['skills']) <= 3:
-                score += 20
-                reasons.append("💪 Fewer skills required - good match potential")
-            elif len(internship['skills']) <= 5:
-                score += 15
-            else:
-                score += 10
-            
-            # Factor 4: Stipend value (0-15 points) - higher stipend = higher priority
-            stipend_str = internship['stipend'].lower()
-            if 'unpaid' in stipend_str or stipend_str == '0':
-                score += 5
-            else:
-                # Try to extract numbers and score based on amount
-                import re
-                numbers = re.findall(r'\d+', stipend_str)
-                if numbers:
-                    amount = int(numbers[0])
-                    if amount >= 50000:
-                        score += 15
-                        reasons.append("💰 Great stipend - high value opportunity")
-                    elif amount >= 20000:
-                        score += 12
-                        reasons.append("💵 Good stipend offered")
-                    else:
-                        score += 8
-            
-            # Factor 5: How long it's been in your list (0-10 points)
-            try:
-                date_added = datetime.strptime(internship['date_added'], "%Y-%m-%d")
-                days_in_list = (datetime.now() - date_added).days
-                
-                if days_in_list >= 30:
-                    score += 10
-                    reasons.append("⌛ Been in your list for a while - time to act")
-                elif days_in_list >= 14:
-                    score += 5
-            except:
-                pass
-            
-            scored_internships.append({
-                'internship': internship,
-                'score': score,
-                'reasons': reasons
-            })
-        
-        # Sort by score (highest first)
-        scored_internships.sort(key=lambda x: x['score'], reverse=True)
+        # Scores are kept up to date as you go - this just catches up on a new day
+        today = datetime.now().date()
+        self.advisor_view.refresh(self.internships, today)
+        top_internships = self.advisor_view.top(5)
         
-        if not scored_internships:
+        if not top_internships:
             print("\n✨ All caught up! No pending applications to prioritize.")
             print("Either everything's been accepted/rejected, or you need to add more internships.")
             return
@@ -684,10 +2889,8 @@ class InternshipTracker:
         print("🎯 TOP PRIORITY APPLICATIONS")
         print("="*60)
         
-        for idx, item in enumerate(scored_internships[:5], 1):
-            internship = item['internship']
-            score = item['score']
-            reasons = item['reasons']
+        for idx, internship in enumerate(top_internships, 1):
+            score, reasons = advisor_score(internship, today)
             
             # Determine priority level
             if score >= 70:
@@ -702,7 +2905,7 @@ class InternshipTracker:
             print(f"\n{idx}. {internship['role']} at {internship['company']}")
             print(f"   Priority: {priority} (Score: {score}/100)")
             print(f"   Status: {internship['status']}")
-            if internship.get('deadline'):
+            if internship['deadline']:
                 print(f"   Deadline: {internship['deadline']}")
             print(f"   Location: {internship['location']}")
             print(f"   \n   Why prioritize this:")
@@ -714,13 +2917,15 @@ class InternshipTracker:
         print("💡 PERSONALIZED INSIGHTS")
         print("="*60)
         
-        # Analyze application patterns
-        total = len(self.internships)
-        not_applied = len([i for i in self.internships if i['status'] == 'Not Applied'])
-        applied = len([i for i in self.internships if i['status'] == 'Applied'])
-        interviews = len([i for i in self.internships if i['status'] in ['Interview Scheduled', 'Interview Completed']])
-        accepted = len([i for i in self.internships if i['status'] == 'Accepted'])
-        rejected = len([i for i in self.internships if i['status'] == 'Rejected'])
+        # Analyze application patterns - archived records still count towards the outcomes
+        archived = self.archive.stats
+        status_counts = self.advisor_view.status_counts + Counter(archived['status'])
+        total = len(self.internships) + archived['total']
+        not_applied = status_counts['Not Applied']
+        applied = status_counts['Applied']
+        interviews = status_counts['Interview Scheduled'] + status_counts['Interview Completed']
+        accepted = status_counts['Accepted']
+        rejected = status_counts['Rejected']
         
         print(f"\n📊 Your Application Pipeline:")
         print(f"   • Total tracked: {total}")
@@ -754,15 +2959,7 @@ class InternshipTracker:
                 print(f"   • Keep applying! More applications = better chances")
         
         # Check for overdue deadlines
-        overdue = 0
-        for internship in self.internships:
-            if internship.get('deadline'):
-                try:
-                    deadline_date = datetime.strptime(internship['deadline'], "%Y-%m-%d")
-                    if (deadline_date - datetime.now()).days < 0:
-                        overdue += 1
-                except:
-                    pass
+        overdue = self.advisor_view.overdue
         
         if overdue > 0:
             print(f"   • ⚠️ You have {overdue} overdue deadline(s) - check if applications are still open")
@@ -770,6 +2967,240 @@ class InternshipTracker:
         print("\n" + "="*60)
         print("💪 Keep hustling! You've got this!")
         print("="*60)
+    
+    def sync_trackers(self):
+        """Two-way sync with another copy of the tracker - only changed records move"""
+        print("\n" + "="*50)
+        print("🔄 SYNC WITH ANOTHER TRACKER")
+        print("="*50)
+        print("\n1. Sync with a data file")
+        print("2. Sync with a server")
+        print(f"3. Serve this tracker for syncing (port {SYNC_PORT})")
+        print("4. Back to Main Menu")
+        
+        choice = input("\nEnter your choice (1-4): ").strip()
+        
+        if choice == '1':
+            path = input("\nPath to the other internships.json: ").strip()
+            if not os.path.exists(path):
+                print("❌ File not found!")
+                return
+            if os.path.abspath(path) == os.path.abspath(self.data_file):
+                print("❌ That's this tracker's own file!")
+                return
+            # Sync needs the whole file in memory, however big it is
+            try:
+                peer = InternshipTracker(path, streaming=False).sync
+            except DataFileError as e:
+                print(f"❌ {e}")
+                return
+            stats = sync_replicas(self.sync, peer)
+        
+        elif choice == '2':
+            address = input(f"\nServer (host[:port], default port {SYNC_PORT}): ").strip()
+            host, _, port = address.partition(':')
+            try:
+                peer = SocketPeer(host or 'localhost', int(port or SYNC_PORT))
+            except (OSError, ValueError) as e:
+                print(f"❌ Couldn't connect: {e}")
+                return
+            try:
+                stats = sync_replicas(self.sync, peer)
+            except (OSError, ConnectionError) as e:
+                print(f"❌ Sync failed: {e}")
+                return
+            finally:
+                peer.close()
+            print(f"   Traffic: {peer.bytes_sent} bytes sent, {peer.bytes_received} bytes received")
+        
+        elif choice == '3':
+            host = input(f"\nAddress to listen on (default {SYNC_BIND_ADDRESS}, this machine only): ").strip()
+            host = host or SYNC_BIND_ADDRESS
+            if host not in (SYNC_BIND_ADDRESS, 'localhost', '::1'):
+                print("⚠️  There's no password - anyone who can reach this address can read and change your tracker.")
+                if input("Serve anyway? (y/n): ").strip().lower() != 'y':
+                    return
+            try:
+                server = SyncServer(self.sync, host)
+            except OSError as e:
+                print(f"❌ Couldn't listen on {host}:{SYNC_PORT}: {e}")
+                return
+            print(f"\n✓ Serving on {host}:{SYNC_PORT} - press Ctrl+C to stop")
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                print("\n✓ Sync server stopped.")
+            finally:
+                server.server_close()
+            return
+        
+        elif choice == '4':
+            return
+        
+        else:
+            print("❌ Invalid choice!")
+            return
+        
+        if stats['pulled'] == 0 and stats['pushed'] == 0:
+            print("\n✓ Already in sync!")
+        else:
+            print(f"\n✓ Sync done: {stats['pulled']} record(s) pulled, {stats['pushed']} pushed")
+        print(f"   Compared {stats['buckets']} bucket(s) in {stats['round_trips']} round trip(s)")
+    
+    def enrich_from_urls(self):
+        """Paste posting URLs and let us fill in the details for you"""
+        print("\n" + "="*50)
+        print("🌐 ADD/ENRICH FROM POSTING URLS")
+        print("="*50)
+        print("\nPaste posting URLs, one per line (blank line to finish),")
+        print("or give the path to a file with one URL per line.")
+        
+        lines = []
+        while True:
+            line = input().strip()
+            if not line:
+                break
+            lines.append(line)
+        if len(lines) == 1 and os.path.isfile(lines[0]):
+            with open(lines[0], 'r') as f:
+                lines = [line.strip() for line in f if line.strip()]
+        
+        # dict.fromkeys drops duplicates but keeps the order
+        urls = list(dict.fromkeys(lines))
+        if not urls:
+            print("❌ No URLs entered!")
+            return
+        
+        print(f"\nFetching {len(urls)} posting(s)...")
+        start = time.perf_counter()
+        results, stats = asyncio.run(enrich_urls(urls, self.extractor))
+        elapsed = time.perf_counter() - start
+        
+        existing = {i['url']: i for i in self.internships if i['url']}
+        added = updated = 0
+        failed = []
+        for url in urls:
+            fields = results[url]
+            if isinstance(fields, FetchError):
+                failed.append(fields)
+                continue
+            
+            internship = existing.get(url)
+            if internship:
+                # Only fill in what's missing - never overwrite what you typed
+                changed = [k for k in ENRICH_FIELDS if not internship[k] and fields.get(k)]
+                for key in changed:
+                    internship[key] = fields[key]
+                if changed:
+                    internship['last_updated'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    self._record_changed(internship)
+                    updated += 1
+                continue
+            
+            internship = {
+                'id': len(self.internships) + 1,
+                'uid': uuid.uuid4().hex,
+                'company': fields.get('company', 'Unknown'),
+                'role': fields.get('role', 'Unknown'),
+                'location': '',
+                'stipend': fields.get('stipend', ''),
+                'duration': fields.get('duration', ''),
+                'skills': fields.get('skills', []),
+                'status': 'Not Applied',
+                'date_added': datetime.now().strftime("%Y-%m-%d"),
+                'deadline': fields.get('deadline', ''),
+                'notes': '',
+                'url': url,
+                'last_updated': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            }
+            self.internships.append(internship)
+            existing[url] = internship
+            self._record_changed(internship)
+            added += 1
+        
+        if added or updated:
+            self.save_data()
+        
+        print(f"\n✓ {added} internship(s) added, {updated} updated in {elapsed:.1f}s")
+        print(f"   Fetched {stats['fetched']}, revalidated {stats['revalidated']}, from cache {stats['cached']}, "
+              f"{stats['retries']} retries over {stats['connections']} connection(s)")
+        if failed:
+            print(f"\n⚠️ {len(failed)} posting(s) couldn't be fetched:")
+            for error in failed[:10]:
+                print(f"   • {error}")
+    
+    def deadline_reminders(self):
+        """Start or stop the background reminder daemon"""
+        print("\n" + "="*50)
+        print("🔔 DEADLINE REMINDERS")
+        print("="*50)
+        
+        if self.reminders and self.reminders.running:
+            print(f"\nReminders are running ({self.reminders.pending()} pending).")
+            confirm = input("Type 'stop' to turn them off: ").strip().lower()
+            if confirm == 'stop':
+                self.reminders.stop()
+                self.listeners.remove(self.reminders)
+                self.reminders = None
+                print("\n✓ Reminders stopped.")
+            return
+        
+        offsets = ', '.join('same day' if d == 0 else f"{d} days" for d in sorted(REMINDER_OFFSETS, reverse=True))
+        print(f"\nYou'll get a reminder {offsets} before each deadline at {REMINDER_HOUR}:00.")
+        print("\nWhere should reminders go?")
+        print("1. Terminal")
+        print(f"2. Log file ({REMINDER_LOG_FILE})")
+        print("3. Desktop notification")
+        choices = input("\nPick one or more (e.g. 1,2) [1]: ").strip() or '1'
+        
+        available = {'1': StdoutSink, '2': FileSink, '3': DesktopNotifySink}
+        sinks = [available[c.strip()]() for c in choices.split(',') if c.strip() in available]
+        if not sinks:
+            print("❌ Invalid choice!")
+            return
+        
+        try:
+            self.reminders = ReminderScheduler(sinks, state_file=self.reminder_state_file)
+        except DataFileError as e:
+            print(f"❌ {e}")
+            return
+        self.reminders.load(self.internships)
+        self.listeners.append(self.reminders)
+        self.reminders.start()
+        print(f"\n✓ Reminders running in the background ({self.reminders.pending()} scheduled).")
+        print("   They stop when you exit - run 'python internship_tracker.py remind' to keep them going without the menu.")
+    
+    def run_reminders(self, reload_every=REMINDER_RELOAD_SECONDS):
+        """Headless mode: only the reminder scheduler, no menu.
+
+        Reminders go to the terminal and the log file. The data file is checked
+        for edits every `reload_every` seconds and the schedule rebuilt from it,
+        so changes made in the menu from another terminal are picked up.
+        """
+        scheduler = ReminderScheduler([StdoutSink(), FileSink()], state_file=self.reminder_state_file)
+        scheduler.load(self._records())
+        scheduler.start()
+        print(f"🔔 Reminders running for {self.data_file} ({scheduler.pending()} scheduled) - press Ctrl+C to stop")
+        
+        seen = os.path.getmtime(self.data_file) if os.path.exists(self.data_file) else None
+        try:
+            while True:
+                time.sleep(reload_every)
+                mtime = os.path.getmtime(self.data_file) if os.path.exists(self.data_file) else None
+                if mtime == seen:
+                    continue
+                try:
+                    if not self.streaming:
+                        self.internships = self.load_data()
+                    scheduler.load(self._records())
+                except DataFileError:
+                    # Probably caught it halfway through a save - try again next time round
+                    continue
+                seen = mtime
+        except KeyboardInterrupt:
+            print("\n✓ Reminders stopped.")
+        finally:
+            scheduler.stop()
 
 def display_menu():
     """Show the main menu - what do you wanna do today?"""
@@ -786,17 +3217,37 @@ def display_menu():
     print("8. Show Upcoming Deadlines")
     print("9. Skill-Based Role Suggestion")
     print("10. 🤖 Smart Application Advisor (AI)")
-    print("11. Exit")
+    print("11. 🔔 Deadline Reminders")
+    print("12. 🔄 Sync with Another Tracker")
+    print("13. 🌐 Add/Enrich from Posting URLs")
+    print("14. Exit")
     print("="*50)
 
 def main():
-    tracker = InternshipTracker()
+    # --include-archived makes searches look through archived records too
+    try:
+        tracker = InternshipTracker(include_archived='--include-archived' in sys.argv[1:])
+    except DataFileError as e:
+        print(f"\n❌ {e}")
+        return
+    # 'remind' (or --reminders) runs just the reminders, without the menu
+    if 'remind' in sys.argv[1:] or '--reminders' in sys.argv[1:]:
+        try:
+            tracker.run_reminders()
+        except DataFileError as e:
+            print(f"\n❌ {e}")
+        return
+    if tracker.streaming:
+        print(f"\n📦 {tracker.data_file} is over {STREAMING_THRESHOLD_BYTES // (1024 * 1024)} MB - "
+              "opening it read-only in streaming mode.")
     
     while True:
         display_menu()
-        choice = input("\nEnter your choice (1-11): ").strip()
+        choice = input("\nEnter your choice (1-14): ").strip()
         
-        if choice == '1':
+        if tracker.streaming and choice not in STREAMING_MENU_CHOICES:
+            print("\n❌ Not available in read-only streaming mode - try View, Search, Statistics or Deadlines.")
+        elif choice == '1':
             tracker.add_internship()
         elif choice == '2':
             tracker.view_all_internships()
@@ -817,11 +3268,19 @@ def main():
         elif choice == '10':
             tracker.smart_advisor()
         elif choice == '11':
+            tracker.deadline_reminders()
+        elif choice == '12':
+            tracker.sync_trackers()
+        elif choice == '13':
+            tracker.enrich_from_urls()
+        elif choice == '14':
+            if tracker.reminders:
+                tracker.reminders.stop()
             print("\n👋 Thank you for using Internship Tracker!")
             print("Good luck with your internship applications! 🚀")
             break
         else:
-            print("\n❌ Invalid choice! Please enter a number between 1 and 11.")
+            print("\n❌ Invalid choice! Please enter a number between 1 and 14.")
         
         input("\nPress Enter to continue...")
 
@@ -0,0 +1,81 @@
+import json
+import random
+from collections import Counter
+from datetime import datetime, timedelta
+
+import internship_tracker as it
+
+
+def day(offset):
+    return (datetime.now() + timedelta(days=offset)).strftime("%Y-%m-%d")
+
+
+def test_due_today_reads_the_same_everywhere(tmp_path, capsys):
+    record = {'id': 1, 'uid': "a" * 32, 'company': "Acme", 'role': "Intern", 'location': "Pune", 'stipend': "",
+              'duration': "", 'skills': [], 'status': "Applied", 'date_added': day(-2), 'deadline': day(0),
+              'notes': "", 'url': "", 'last_updated': f"{day(-2)} 00:00:00"}
+    path = tmp_path / "internships.json"
+    path.write_text(json.dumps({'schema_version': it.CURRENT_SCHEMA_VERSION, 'internships': [record]}))
+    tracker = it.InternshipTracker(str(path))
+    
+    tracker.smart_advisor()
+    tracker.show_upcoming_deadlines()
+    tracker.view_all_internships()
+    out = capsys.readouterr().out
+    assert "Deadline is TODAY" in out
+    assert "(🔥 TODAY!)" in out
+    assert f"Deadline: {day(0)} 🔥 TODAY!" in out
+    assert "Overdue" not in out and "OVERDUE" not in out
+
+
+def random_record(rng, n, today):
+    when = lambda lo, hi: (today + timedelta(days=rng.randint(lo, hi))).strftime("%Y-%m-%d")
+    return {'id': n, 'status': rng.choice(it.STATUSES), 'deadline': rng.choice(["", when(-5, 40)]),
+            'date_added': when(-60, 0), 'skills': ["x"] * rng.randint(0, 7),
+            'stipend': rng.choice(["", "Unpaid", "0", "15000", "25000", "60000"])}
+
+
+def test_view_matches_a_full_rescore():
+    rng = random.Random(5)
+    today = datetime.now().date()
+    internships = [random_record(rng, n, today) for n in range(150)]
+    view = it.AdvisorView()
+    view.refresh(internships, today)
+    
+    for step in range(400):
+        action = rng.random()
+        if action < 0.1:
+            today += timedelta(days=rng.randint(1, 5))
+            view.refresh(internships, today)
+        elif action < 0.2 and internships:
+            view.record_removed(internships.pop(rng.randrange(len(internships))))
+        elif action < 0.3:
+            internships.append(random_record(rng, 1000 + step, today))
+            view.record_changed(internships[-1])
+        elif internships:
+            record = rng.choice(internships)
+            field = rng.choice(['status', 'deadline', 'date_added', 'skills', 'stipend'])
+            record[field] = random_record(rng, 0, today)[field]
+            view.record_changed(record)
+        
+        scores = sorted((s[0] for s in (it.advisor_score(i, today) for i in internships) if s), reverse=True)
+        assert [it.advisor_score(i, today)[0] for i in view.top(5)] == scores[:5]
+        assert +view.status_counts == Counter(i['status'] for i in internships)
+        assert view.overdue == sum(1 for i in internships if i['deadline'] and i['deadline'] < str(today))
+
+
+def test_indexed_heap_top_matches_sorting():
+    rng = random.Random(9)
+    heap = it.IndexedHeap()
+    keys = {}
+    records = [{'n': n} for n in range(100)]
+    for _ in range(1000):
+        record = rng.choice(records)
+        if rng.random() < 0.25:
+            heap.remove(record)
+            keys.pop(record['n'], None)
+        else:
+            keys[record['n']] = (rng.randint(-100, 0), record['n'])
+            heap.set(record, keys[record['n']])
+        assert len(heap) == len(keys)
+        assert [key for key, _ in heap.top(5)] == sorted(keys.values())[:5]
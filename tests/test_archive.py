@@ -0,0 +1,44 @@
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+import internship_tracker as it
+
+
+def record(n, status, days_ago):
+    when = datetime.now() - timedelta(days=days_ago)
+    return {'id': n, 'uid': f"{n:032x}", 'company': f"Company {n}", 'role': "Intern", 'location': "Pune",
+            'stipend': '', 'duration': '', 'skills': [], 'status': status, 'date_added': when.strftime("%Y-%m-%d"),
+            'deadline': '', 'notes': '', 'url': '', 'last_updated': when.strftime("%Y-%m-%d %H:%M:%S")}
+
+
+def write_tracker(path, records):
+    with open(path, 'w') as f:
+        json.dump({'schema_version': it.CURRENT_SCHEMA_VERSION, 'internships': records}, f)
+    return str(path)
+
+
+def test_advisor_insights_count_archived_records(tmp_path, capsys):
+    records = [record(1, "Applied", 1)] + [record(n, "Accepted", 90) for n in (2, 3)] + [record(4, "Rejected", 90)]
+    tracker = it.InternshipTracker(write_tracker(tmp_path / "internships.json", records))
+    assert len(tracker.internships) == 1 and tracker.archive.stats['total'] == 3
+    
+    tracker.smart_advisor()
+    out = capsys.readouterr().out
+    assert "Total tracked: 4" in out
+    assert "Accepted: 2" in out
+    assert "Rejected: 1" in out
+    assert "50.0% acceptance rate" in out
+
+
+def test_damaged_stats_file_stops_startup(tmp_path):
+    path = write_tracker(tmp_path / "internships.json", [record(1, "Applied", 1), record(2, "Accepted", 90)])
+    it.InternshipTracker(path)
+    stats_file = tmp_path / "internships.archive.stats.json"
+    assert json.loads(stats_file.read_text())['total'] == 1
+    assert not (tmp_path / "internships.archive.stats.json.tmp").exists()
+    
+    stats_file.write_text('{"total": 1, "sta')
+    with pytest.raises(it.DataFileError, match="archive.stats.json is damaged"):
+        it.InternshipTracker(path)
@@ -0,0 +1,109 @@
+import asyncio
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import internship_tracker as it
+
+POSTING = """<html><head><title>Data Analyst Intern at Acme</title></head>
+<body><p>Skills: Python, SQL</p><p>Stipend: Rs. 15,000</p><p>Duration: 3 months</p>
+<p>Apply by 30 November 2026</p></body></html>"""
+
+
+class PostingHandler(BaseHTTPRequestHandler):
+    """Stand-in job board: ETags, one flaky path, one redirect"""
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        hits = self.server.hits
+        hits[self.path] += 1
+        if self.path == '/flaky' and hits[self.path] == 1:
+            return self.reply(503, b'')
+        if self.path == '/moved':
+            return self.reply(301, b'', {'Location': '/posting'})
+        if self.headers.get('If-None-Match') == '"v1"':
+            return self.reply(304, None, {'ETag': '"v1"'})
+        self.reply(200, POSTING.encode(), {'ETag': '"v1"', 'Content-Type': 'text/html; charset=utf-8'})
+
+    def reply(self, status, body, headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if body is not None:
+            self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def board():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), PostingHandler)
+    server.hits = Counter()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def quick_backoff(monkeypatch):
+    monkeypatch.setattr(it, 'ENRICH_BACKOFF', 0.01)
+
+
+def url(server, path):
+    return f"http://127.0.0.1:{server.server_address[1]}{path}"
+
+
+def enrich(urls, tmp_path, **kwargs):
+    return asyncio.run(it.enrich_urls(urls, cache_dir=str(tmp_path / "cache"), **kwargs))
+
+
+def test_fields_come_out_of_the_page(board, tmp_path):
+    results, stats = enrich([url(board, '/posting'), url(board, '/moved')], tmp_path)
+    for fields in results.values():
+        assert fields['role'] == "Data Analyst Intern"
+        assert fields['company'] == "Acme"
+        assert fields['stipend'] == "15000"
+        assert fields['deadline'] == "2026-11-30"
+        assert {'Python', 'SQL'} <= set(fields['skills'])
+    assert stats['fetched'] == 2
+
+
+def test_cached_pages_are_revalidated(board, tmp_path):
+    enrich([url(board, '/posting')], tmp_path)
+    results, stats = enrich([url(board, '/posting')], tmp_path)
+    assert results[url(board, '/posting')]['company'] == "Acme"
+    assert stats['revalidated'] == 1 and stats['fetched'] == 0
+
+
+def test_server_errors_are_retried(board, tmp_path):
+    results, stats = enrich([url(board, '/flaky')], tmp_path)
+    assert results[url(board, '/flaky')]['company'] == "Acme"
+    assert stats['retries'] == 1
+    assert board.hits['/flaky'] == 2
+
+
+def test_extractor_failure_stays_with_its_url(board, tmp_path):
+    def extractor(page, page_url):
+        if page_url.endswith('/moved'):
+            raise KeyError('title')
+        return it.extract_posting_fields(page, page_url)
+
+    results, _ = enrich([url(board, '/moved'), url(board, '/posting')], tmp_path, extractor=extractor)
+    assert isinstance(results[url(board, '/moved')], it.FetchError)
+    assert results[url(board, '/posting')]['company'] == "Acme"
+
+
+def test_malformed_url_fails_without_retrying(tmp_path):
+    start = time.monotonic()
+    results, stats = enrich(["http://h:99999x/", "ftp://example.com/job"], tmp_path)
+    assert all(isinstance(r, it.FetchError) for r in results.values())
+    assert stats['retries'] == 0
+    assert time.monotonic() - start < 1
@@ -0,0 +1,111 @@
+import json
+
+import pytest
+
+import internship_tracker as it
+
+
+def test_status_matches_regardless_of_case():
+    record = it.normalize_record({'company': "Acme", 'status': " applied ", 'date_added': "2026-01-05"})
+    assert record['status'] == "Applied"
+    assert record['notes'] == ''
+
+
+def test_unreadable_fields_are_kept_in_notes():
+    record = it.normalize_record({'company': "Acme", 'status': "Ghosted", 'date_added': "05/01/2026",
+                                  'deadline': "soon", 'notes': "Call back"})
+    assert record['status'] == "Not Applied"
+    assert record['deadline'] == ''
+    assert it._valid_date(record['date_added'])
+    assert record['notes'] == "Call back (status was: Ghosted) (date added was: 05/01/2026) (deadline was: soon)"
+
+
+def test_legacy_uid_ignores_the_fallback_date():
+    raw = {'company': "Acme", 'role': "Intern", 'date_added': "not a date"}
+    assert it.normalize_record(raw)['uid'] == it.normalize_record(dict(raw, id=7, status="Applied"))['uid']
+
+
+def test_corrupt_v1_file_is_left_alone(tmp_path):
+    path = tmp_path / "internships.json"
+    original = '[\n    {"company": "Acme", "status": "Applied"},\n    {"company": "Glo\n'
+    path.write_text(original)
+    with pytest.raises(it.DataFileError, match="hasn't been touched"):
+        it.InternshipTracker(str(path))
+    assert path.read_text() == original
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["internships.json"]
+
+
+@pytest.mark.parametrize("content", [
+    '{\n    "schema_version": 2,\n    "internships": [\n        {"company": "Ac',
+    '{"schema_version": 2, "records": []}',
+])
+def test_unreadable_v2_file_is_left_alone(tmp_path, content):
+    path = tmp_path / "internships.json"
+    path.write_text(content)
+    with pytest.raises(it.DataFileError, match="hasn't been touched"):
+        it.InternshipTracker(str(path))
+    assert path.read_text() == content
+
+
+class Interrupted(Exception):
+    pass
+
+
+def write_v1_file(path, count):
+    records = [{'id': n + 1, 'company': f"Company {n % 7}", 'role': "Intern", 'status': "applied",
+                'date_added': "2026-03-01", 'skills': "Python, SQL"} for n in range(count)]
+    path.write_text(json.dumps(records, indent=4))
+    return str(path)
+
+
+@pytest.fixture
+def counted_step(monkeypatch):
+    """Wrap the v1 step so tests can see which records it ran for, and stop it partway"""
+    monkeypatch.setattr(it, 'MIGRATION_CHECKPOINT_EVERY', 10)
+    step = it.MIGRATIONS[1]
+    calls = {'positions': [], 'stop_at': None}
+    
+    def counted(internship, context):
+        if context['position'] == calls['stop_at']:
+            raise Interrupted()
+        calls['positions'].append(context['position'])
+        return step(internship, context)
+    
+    monkeypatch.setitem(it.MIGRATIONS, 1, counted)
+    return calls
+
+
+def test_interrupted_migration_resumes_from_checkpoint(tmp_path, counted_step):
+    clean = write_v1_file(tmp_path / "clean.json", 80)
+    it.migrate_data_file(clean)
+    
+    path = write_v1_file(tmp_path / "internships.json", 80)
+    counted_step['stop_at'] = 57
+    with pytest.raises(Interrupted):
+        it.migrate_data_file(path)
+    assert json.loads((tmp_path / "internships.json.migrating.json").read_text())['records_done'] == 50
+    
+    counted_step['stop_at'] = None
+    counted_step['positions'] = []
+    assert it.migrate_data_file(path) == 80
+    assert counted_step['positions'] == list(range(50, 80))
+    assert (tmp_path / "internships.json").read_text() == (tmp_path / "clean.json").read_text()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["clean.json", "internships.json"]
+
+
+def test_changed_source_starts_over(tmp_path, counted_step):
+    path = write_v1_file(tmp_path / "internships.json", 80)
+    counted_step['stop_at'] = 57
+    with pytest.raises(Interrupted):
+        it.migrate_data_file(path)
+    
+    # Someone edited the old file in between, so the half-done output is no good
+    write_v1_file(tmp_path / "internships.json", 81)
+    counted_step['stop_at'] = None
+    counted_step['positions'] = []
+    assert it.migrate_data_file(path) == 81
+    assert counted_step['positions'] == list(range(81))
+    
+    clean = write_v1_file(tmp_path / "clean.json", 81)
+    it.migrate_data_file(clean)
+    assert (tmp_path / "internships.json").read_text() == (tmp_path / "clean.json").read_text()
@@ -0,0 +1,151 @@
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+import internship_tracker as it
+
+SKILLS = ["Python", "SQL", "Java", "Excel", "React"]
+QUERIES = [
+    "status=Applied",
+    "skill=python & location~pune",
+    "deadline<2026-03-01 | status=rejected",
+    "added>=2026-06-01 & added<=2026-08-31 & !skill=sql",
+    "(status=applied | status=accepted) & deadline>2026-02-01",
+    "deadline=2026-05-05",
+]
+
+
+def make_record(rng, n):
+    return {'id': n, 'company': f"Company {n}", 'role': "Intern", 'location': rng.choice(["Pune", "Delhi"]),
+            'stipend': "1000", 'duration': "", 'notes': "", 'status': rng.choice(it.STATUSES),
+            'skills': rng.sample(SKILLS, rng.randint(0, 3)),
+            'deadline': rng.choice(["", f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}", "2026-05-05"]),
+            'date_added': f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"}
+
+
+def brute_force(text, internships):
+    tree = it.QueryParser(text, datetime.now()).parse()
+    return [i for i in internships if tree.matches(i)]
+
+
+def ids(rows):
+    return sorted(i['id'] for i in rows)
+
+
+def test_index_stays_in_step_with_edits():
+    rng = random.Random(7)
+    internships = [make_record(rng, n + 1) for n in range(200)]
+    engine = it.QueryEngine()
+    for step in range(300):
+        action = rng.random()
+        if action < 0.2 and internships:
+            gone = internships.pop(rng.randrange(len(internships)))
+            engine.record_removed(gone)
+        elif action < 0.3:
+            internships.append(make_record(rng, 1000 + step))
+            engine.record_changed(internships[-1])
+        elif internships:
+            record = rng.choice(internships)
+            field = rng.choice(['status', 'skills', 'deadline', 'date_added'])
+            record[field] = make_record(rng, 0)[field]
+            engine.record_changed(record)
+        for text in QUERIES:
+            assert ids(engine.run(text, internships)) == ids(brute_force(text, internships)), text
+
+
+def test_unindexed_edits_keep_the_index_and_plans():
+    rng = random.Random(3)
+    internships = [make_record(rng, n + 1) for n in range(50)]
+    engine = it.QueryEngine()
+    engine.run("status=Applied", internships)
+    generation = engine.index.generation
+    internships[4]['notes'] = "Followed up"
+    internships[4]['stipend'] = "5000"
+    engine.record_changed(internships[4])
+    assert engine.index.generation == generation
+    assert engine.explain("status=Applied", internships)[-1] == "Plan cache: hit"
+
+
+def parse(text):
+    return it.QueryParser(text, datetime.now()).parse()
+
+
+def test_and_binds_tighter_than_or():
+    tree = parse("status=applied | skill=python & location~pune")
+    assert isinstance(tree, it.AnyOf)
+    assert isinstance(tree.children[1], it.AllOf)
+    assert str(parse("(status=applied | status=accepted) & !skill=sql")) == \
+        "(status = 'applied' | status = 'accepted') & !(skill = 'sql')"
+
+
+def test_quoted_values_keep_operators_and_brackets():
+    tree = parse("company = 'Acme | Co' & notes~\"call (again)\"")
+    assert [c.value for c in tree.children] == ["acme | co", "call (again)"]
+
+
+def test_relative_dates_are_pinned_to_today():
+    in_ten = (datetime.now() + timedelta(days=10)).strftime("%Y-%m-%d")
+    two_weeks_ago = (datetime.now() - timedelta(weeks=2)).strftime("%Y-%m-%d")
+    assert parse("deadline<=+10d").value == in_ten
+    assert parse("added>-2w").value == two_weeks_ago
+    assert parse("deadline=today").value == datetime.now().strftime("%Y-%m-%d")
+
+
+@pytest.fixture
+def internships():
+    rng = random.Random(11)
+    return [make_record(rng, n + 1) for n in range(60)]
+
+
+def test_union_drives_an_or_of_indexed_conditions(internships):
+    engine = it.QueryEngine()
+    text = "(status=applied | status=accepted) & location~pune"
+    lines = engine.explain(text, internships)
+    assert lines[1].startswith("  → UNION of INDEX LOOKUP status = 'applied', INDEX LOOKUP status = 'accepted'")
+    assert lines[2] == "  → FILTER location ~ 'pune'"
+    assert ids(engine.run(text, internships)) == ids(brute_force(text, internships))
+
+
+def test_most_selective_condition_drives(internships):
+    engine = it.QueryEngine()
+    text = "status=applied & deadline=2026-05-05"
+    plan, _ = engine.plan(text, internships)
+    index = engine.index
+    assert index.estimate(plan.driver) == min(index.estimate(c) for c in plan.tree.children)
+    assert ids(engine.run(text, internships)) == ids(brute_force(text, internships))
+
+
+def test_unindexable_query_is_a_full_scan(internships):
+    engine = it.QueryEngine()
+    lines = engine.explain("location~pune | status!=applied", internships)
+    assert lines[1] == f"  → FULL SCAN of {len(internships)} rows"
+    assert lines[2] == "  → FILTER location ~ 'pune' | status != 'applied'"
+    assert lines[3] == f"Rows examined: {len(internships)} of {len(internships)}"
+
+
+def test_plan_cache_hits_until_an_indexed_change(internships):
+    engine = it.QueryEngine()
+    assert engine.explain("status=applied", internships)[-1] == "Plan cache: miss"
+    assert engine.explain("  status=applied ", internships)[-1] == "Plan cache: hit"
+    internships[0]['status'] = "Applied" if internships[0]['status'] != "Applied" else "Withdrawn"
+    engine.record_changed(internships[0])
+    assert engine.explain("status=applied", internships)[-1] == "Plan cache: miss"
+
+
+@pytest.mark.parametrize("text, message", [
+    ("colour=red", "Unknown field 'colour'"),
+    ("(status=applied", "Missing ')'"),
+    ("company='Acme", "Unterminated quote"),
+    ("location<pune", "'<' only works on deadline, added and stipend"),
+    ("stipend>lots", "Stipend comparisons need a number, got 'lots'"),
+    ("deadline<soon", "Don't know what date 'soon' is"),
+    ("status=", "Missing value for 'status='"),
+    ("status applied", "Expected an operator after 'status'"),
+    ("status=applied )", "Unexpected ')'"),
+    ("& status=applied", "Expected a field name at '& status=applied'"),
+])
+def test_bad_queries_say_what_is_wrong(text, message):
+    with pytest.raises(it.QueryError) as error:
+        parse(text)
+    assert str(error.value).startswith(message)
@@ -0,0 +1,153 @@
+import json
+import os
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+import internship_tracker as it
+
+
+class ListSink:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, title, message):
+        self.sent.append(title)
+
+
+def in_days(days):
+    return (datetime.now() + timedelta(days=days)).strftime("%Y-%m-%d")
+
+
+def wait_for(condition, timeout=2):
+    end = time.monotonic() + timeout
+    while not condition() and time.monotonic() < end:
+        time.sleep(0.01)
+    return condition()
+
+
+@pytest.fixture
+def scheduler(monkeypatch):
+    # Midnight reminders are always already due, so today's go off straight away
+    monkeypatch.setattr(it, 'REMINDER_HOUR', 0)
+    sink = ListSink()
+    scheduler = it.ReminderScheduler([sink])
+    scheduler.sink = sink
+    yield scheduler
+    scheduler.stop()
+
+
+def internship(deadline, status="Applied"):
+    return {'id': 1, 'uid': "abc", 'company': "Acme", 'role': "Intern",
+            'deadline': deadline, 'status': status, 'notes': ''}
+
+
+def test_editing_notes_does_not_resend(scheduler):
+    record = internship(in_days(3))
+    scheduler.load([record])
+    assert scheduler.pending() == 2
+    scheduler.start()
+    assert wait_for(lambda: scheduler.sink.sent == ["Deadline in 3 days"])
+    assert scheduler.pending() == 1
+    
+    for note in ("Emailed HR", "Emailed HR again"):
+        record['notes'] = note
+        scheduler.record_changed(record)
+    time.sleep(0.1)
+    assert scheduler.sink.sent == ["Deadline in 3 days"]
+    assert scheduler.pending() == 1
+
+
+def test_moving_the_deadline_reschedules(scheduler):
+    record = internship(in_days(3))
+    scheduler.load([record])
+    scheduler.start()
+    assert wait_for(lambda: len(scheduler.sink.sent) == 1)
+    
+    record['deadline'] = in_days(7)
+    scheduler.record_changed(record)
+    assert wait_for(lambda: scheduler.sink.sent == ["Deadline in 3 days", "Deadline in 7 days"])
+    assert scheduler.pending() == 2
+    
+    # Back to the old deadline - the 3-day reminder already went out for it
+    record['deadline'] = in_days(3)
+    scheduler.record_changed(record)
+    time.sleep(0.1)
+    assert len(scheduler.sink.sent) == 2
+    assert scheduler.pending() == 1
+
+
+def test_pending_follows_removals(scheduler):
+    records = [dict(internship(in_days(10)), uid=str(n)) for n in range(3)]
+    scheduler.load(records)
+    assert scheduler.pending() == 9
+    # Only each record's next reminder sits in the heap
+    assert len(scheduler._heap) == 3
+    scheduler.record_removed(records[0])
+    assert scheduler.pending() == 6
+    records[1]['status'] = "Withdrawn"
+    scheduler.record_changed(records[1])
+    assert scheduler.pending() == 3
+
+
+def test_fired_reminders_survive_a_restart(monkeypatch, tmp_path):
+    monkeypatch.setattr(it, 'REMINDER_HOUR', 0)
+    state = str(tmp_path / "internships.reminders.json")
+    first = it.ReminderScheduler([ListSink()], state_file=state)
+    first.load([internship(in_days(3))])
+    first.start()
+    assert wait_for(lambda: len(first.sinks[0].sent) == 1)
+    first.stop()
+    
+    # A restart after 09:00 would turn the missed same-day slot into "fire now" - unless we remember it
+    second = it.ReminderScheduler([ListSink()], state_file=state)
+    second.load([internship(in_days(3))])
+    assert second.pending() == 1
+    second.start()
+    time.sleep(0.1)
+    second.stop()
+    assert second.sinks[0].sent == []
+
+
+def test_headless_reminders_follow_the_data_file(monkeypatch, tmp_path):
+    monkeypatch.setattr(it, 'REMINDER_HOUR', 0)
+    monkeypatch.chdir(tmp_path)
+    record = dict(internship(in_days(3)), role="Intern", location='', stipend='', duration='', skills=[],
+                  date_added=in_days(0), url='', last_updated=f"{in_days(0)} 00:00:00")
+    path = tmp_path / "internships.json"
+    path.write_text(json.dumps({'schema_version': it.CURRENT_SCHEMA_VERSION, 'internships': [record]}))
+    log = tmp_path / it.REMINDER_LOG_FILE
+    
+    def sent():
+        return log.read_text().count("Deadline") if log.exists() else 0
+    
+    real_sleep = time.sleep
+    
+    def run(steps):
+        """Drive run_reminders through its reload loop, then Ctrl+C it"""
+        steps = iter(steps)
+        
+        def fake_sleep(seconds):
+            step = next(steps, None)
+            if step is None:
+                raise KeyboardInterrupt
+            step()
+        
+        monkeypatch.setattr(it, 'time', type('FakeTime', (), {'sleep': staticmethod(fake_sleep)}))
+        try:
+            it.InternshipTracker(str(path)).run_reminders()
+        finally:
+            monkeypatch.setattr(it, 'time', time)
+    
+    def move_deadline():
+        assert wait_for(lambda: sent() == 1)
+        record['deadline'] = in_days(7)
+        path.write_text(json.dumps({'schema_version': it.CURRENT_SCHEMA_VERSION, 'internships': [record]}))
+        os.utime(path, (time.time() + 5, time.time() + 5))
+    
+    run([move_deadline, lambda: None, lambda: wait_for(lambda: sent() == 2)])
+    assert sent() == 2
+    # Starting it again sends nothing new
+    run([lambda: real_sleep(0.2)])
+    assert sent() == 2
@@ -0,0 +1,64 @@
+import json
+
+import pytest
+
+import internship_tracker as it
+
+CHUNK_SIZES = [1, 2, 3, 64]
+
+ARRAYS = [
+    '[]',
+    '  [ ]  ',
+    '[1, 2.5, -3e10, 12345678901234567890, 0.000001, -0, true, false, null]',
+    '["a]b", "c,d", "e\\"]", "f\\\\", "\\u00e9t\\u00e9 ]", "", "[,]"]',
+    '[[1, [2, [3]]], {"a": [1, ",", "]"]}, [], {}]',
+    json.dumps([{'id': n, 'company': f"Co, {n}]", 'stipend': n * 1.5, 'skills': ["C++", "]"]}
+                for n in range(20)], indent=4),
+]
+
+OBJECTS = [
+    '{"internships": []}',
+    '{"schema_version": 2, "internships": [1, 2.75, 3]}',
+    '{"meta": [[1, [2]], {"x": "]"}], "notes": "internships", "internships": [{"a": [1]}, [2]]}',
+    json.dumps({'schema_version': 2, 'internships': [{'id': n, 'notes': "a, ]} b"} for n in range(15)]},
+               indent=4),
+]
+
+
+def write(tmp_path, text):
+    path = tmp_path / "data.json"
+    path.write_text(text, encoding='utf-8')
+    return str(path)
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+@pytest.mark.parametrize("text", ARRAYS)
+def test_bare_arrays_match_json_load(tmp_path, text, chunk_size):
+    path = write(tmp_path, text)
+    assert list(it.iter_json_array(path, chunk_size=chunk_size)) == json.loads(text)
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+@pytest.mark.parametrize("text", OBJECTS)
+def test_keyed_arrays_match_json_load(tmp_path, text, chunk_size):
+    path = write(tmp_path, text)
+    assert list(it.iter_json_array(path, chunk_size=chunk_size, key='internships')) == json.loads(text)['internships']
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+@pytest.mark.parametrize("text", [
+    '[1,]',
+    '[1, 2 ,\n]',
+    '[1 2]',
+    '[,1]',
+    '[1, 2',
+    '{"schema_version": 2, "internships": [{"a": 1},]}',
+    '{"schema_version": 2 "internships": []}',
+    '{"schema_version": 2, }',
+])
+def test_malformed_input_is_rejected(tmp_path, text, chunk_size):
+    path = write(tmp_path, text)
+    with pytest.raises(ValueError):
+        json.loads(text)
+    with pytest.raises(ValueError):
+        list(it.iter_json_array(path, chunk_size=chunk_size, key='internships'))
@@ -0,0 +1,163 @@
+import json
+import socket
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+import internship_tracker as it
+
+
+def v1_records(count):
+    """A pre-versioning file: a bare list, no uids, ids straight from the old numbering"""
+    added = (datetime.now() - timedelta(days=3)).strftime("%Y-%m-%d")
+    return [{'id': n + 1, 'company': f"Company {n}", 'role': "Data Analyst", 'location': "Pune",
+             'skills': ["SQL"], 'status': "Applied", 'date_added': added, 'deadline': '', 'notes': ''}
+            for n in range(count)]
+
+
+def write_v1(path, records):
+    with open(path, 'w') as f:
+        json.dump(records, f, indent=4)
+    return str(path)
+
+
+def test_legacy_uids_survive_renumbering(tmp_path):
+    records = v1_records(6)
+    # The copy had record 2 deleted before upgrading, so everything after it got renumbered
+    copy = [dict(r) for r in records if r['id'] != 2]
+    for n, record in enumerate(copy):
+        record['id'] = n + 1
+    
+    a = it.InternshipTracker(write_v1(tmp_path / "a.json", records))
+    b = it.InternshipTracker(write_v1(tmp_path / "b.json", copy))
+    shared = {i['uid'] for i in a.internships} & {i['uid'] for i in b.internships}
+    assert len(shared) == 5
+    
+    it.sync_replicas(a.sync, b.sync)
+    
+    for tracker in (a, b):
+        uids = [i['uid'] for i in tracker.internships]
+        assert len(uids) == len(set(uids)) == 6
+    assert {i['uid'] for i in a.internships} == {i['uid'] for i in b.internships}
+    assert a.sync.root() == b.sync.root()
+
+
+def test_duplicate_legacy_records_get_distinct_uids(tmp_path):
+    record = v1_records(1)[0]
+    tracker = it.InternshipTracker(write_v1(tmp_path / "dupes.json", [record, dict(record, id=2)]))
+    assert len({i['uid'] for i in tracker.internships}) == 2
+
+
+def test_sync_over_socket_server(tmp_path):
+    a = it.InternshipTracker(write_v1(tmp_path / "a.json", v1_records(3)))
+    b = it.InternshipTracker(write_v1(tmp_path / "b.json", v1_records(5)))
+    server = it.SyncServer(b.sync, port=0)
+    assert server.server_address[0] == '127.0.0.1'
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        peer = it.SocketPeer(*server.server_address)
+        try:
+            it.sync_replicas(a.sync, peer)
+        finally:
+            peer.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert a.sync.root() == b.sync.root()
+    assert len(a.internships) == len(b.internships) == 5
+
+
+def v2_record(n, status, days_ago):
+    when = datetime.now() - timedelta(days=days_ago)
+    return {'id': n, 'uid': f"{n:032x}", 'company': f"Company {n}", 'role': "Intern", 'location': "Pune",
+            'stipend': '', 'duration': '', 'skills': ["SQL"], 'status': status,
+            'date_added': when.strftime("%Y-%m-%d"), 'deadline': '', 'notes': '', 'url': '',
+            'last_updated': when.strftime("%Y-%m-%d %H:%M:%S")}
+
+
+def write_v2(path, records):
+    with open(path, 'w') as f:
+        json.dump({'schema_version': it.CURRENT_SCHEMA_VERSION, 'internships': records}, f)
+    return str(path)
+
+
+def test_archived_records_sync_like_live_ones(tmp_path):
+    records = [v2_record(1, "Applied", 1), v2_record(2, "Rejected", 90), v2_record(3, "Accepted", 90)]
+    a = it.InternshipTracker(write_v2(tmp_path / "a.json", records))
+    # b keeps everything live - archiving is a local choice and mustn't look like a difference
+    b = it.InternshipTracker(write_v2(tmp_path / "b.json", records), archive_after_days=365)
+    assert len(a.archive) == 2 and len(b.internships) == 3
+    assert a.sync.root() == b.sync.root()
+    
+    # A newer edit on b has to reach a even though a archived its copy
+    edited = next(i for i in b.internships if i['uid'] == records[1]['uid'])
+    edited['status'] = "Interview Scheduled"
+    edited['last_updated'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    b._record_changed(edited)
+    stats = it.sync_replicas(a.sync, b.sync)
+    assert stats['pulled'] == 1
+    assert a.sync.root() == b.sync.root()
+    assert [i['status'] for i in a.internships if i['uid'] == edited['uid']] == ["Interview Scheduled"]
+    assert edited['uid'] not in a.archive
+    assert len(a.archive) == 1 and a.archive.stats['status'] == {'Accepted': 1}
+    assert it.sync_replicas(a.sync, b.sync)['pulled'] == 0
+
+
+def test_archived_records_reach_a_peer_that_never_had_them(tmp_path):
+    a = it.InternshipTracker(write_v2(tmp_path / "a.json", [v2_record(1, "Applied", 1), v2_record(2, "Accepted", 90)]))
+    b = it.InternshipTracker(write_v2(tmp_path / "b.json", [v2_record(1, "Applied", 1)]))
+    stats = it.sync_replicas(a.sync, b.sync)
+    assert stats['pushed'] == 1
+    assert a.sync.root() == b.sync.root()
+    assert [i['status'] for i in b.archive] == ["Accepted"]
+    
+    # And the tree still matches once b reopens with its archive on disk
+    reopened = it.InternshipTracker(str(tmp_path / "b.json"))
+    assert reopened.sync.root() == a.sync.root()
+
+
+def test_bare_uid_archive_index_is_upgraded(tmp_path):
+    a = it.InternshipTracker(write_v2(tmp_path / "a.json", [v2_record(1, "Rejected", 90)]))
+    before = a.sync.root()
+    with open(a.archive.index_file, 'w') as f:
+        f.write(f"{v2_record(1, 'Rejected', 90)['uid']}\n")
+    assert it.InternshipTracker(str(tmp_path / "a.json")).sync.root() == before
+
+
+def test_damaged_sync_state_stops_startup(tmp_path):
+    path = write_v2(tmp_path / "a.json", [v2_record(1, "Applied", 1), v2_record(2, "Applied", 1)])
+    a = it.InternshipTracker(path)
+    a._remove_record(a.internships[0])
+    state = tmp_path / "a.sync.json"
+    assert len(json.loads(state.read_text())['tombstones']) == 1
+    assert not (tmp_path / "a.sync.json.tmp").exists()
+    
+    state.write_text('{"tombstones": {"00')
+    with pytest.raises(it.DataFileError, match="a.sync.json is damaged"):
+        it.InternshipTracker(path)
+
+
+def test_server_answers_bad_requests_and_keeps_going(tmp_path):
+    a = it.InternshipTracker(write_v2(tmp_path / "a.json", [v2_record(1, "Applied", 1)]))
+    server = it.SyncServer(a.sync, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        with socket.create_connection(server.server_address, timeout=5) as sock, sock.makefile('rwb') as stream:
+            
+            def call(request):
+                stream.write(request.encode() + b'\n')
+                stream.flush()
+                return json.loads(stream.readline())
+            
+            assert call('{"op": "put", "args": [["not", "a", "dict"]]}') == {'error': "ValueError: put takes (dict)"}
+            assert 'error' in call('{"op": "put", "args": [{"x": "not a record"}]}')
+            assert 'error' in call('{"op": "children"}')
+            assert 'error' in call('{"op": "format_disk"}')
+            assert 'error' in call('[1, 2]')
+            assert 'error' in call('not json')
+            assert call('{"op": "root"}') == {'result': a.sync.root()}
+    finally:
+        server.shutdown()
+        server.server_close()